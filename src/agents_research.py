@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import weakref
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 import openai
 from agents import Agent, AgentOutputSchema, ModelSettings, Runner, WebSearchTool
@@ -16,8 +19,12 @@ from .models import (
     ClaimExtractionOutput,
     ClinicalReasoningOutput,
     SafetyValidationOutput,
-    VerificationReport,
+    VerificationClaimsOutput,
 )
+from .utils import llm_max_concurrency
+
+if TYPE_CHECKING:
+    from agents import AgentOutputSchemaBase, Tool
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +35,7 @@ AGENT_TEMPERATURES: dict[str, float] = {
     "Web Evidence Synthesis Agent": 0.5,
     "UTI Diagnosis Report Agent": 0.3,
     "Claims & Citations Extractor": 0.05,
-    "Plan Verification Agent": 0.0,
+    "Plan Verification & Claims Agent": 0.0,
 }
 
 
@@ -63,17 +70,50 @@ def _create_agent(name: str, model: str, instructions: str, output_type=None, to
     return Agent(**agent_kwargs)
 
 
+# Every agent call shares one cap, so concurrent orchestrations queue instead
+# of tripping upstream rate limits. Keep one semaphore per event loop: it binds
+# to the first loop that waits on it, and the CLI and tests run several loops.
+_LLM_SEMAPHORES: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _llm_semaphore() -> asyncio.Semaphore:
+    # Created on first use so LLM_MAX_CONCURRENCY can come from a loaded .env
+    loop = asyncio.get_running_loop()
+    semaphore = _LLM_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _LLM_SEMAPHORES[loop] = asyncio.Semaphore(llm_max_concurrency())
+    return semaphore
+
+
+# Each attempt holds a slot only while it talks to the model, so retry backoff
+# in execute_agent never sits on the cap.
+async def _run_streamed(
+    agent: Agent, prompt: str, buf: list[str], citations: list[dict], seen: set[str],
+) -> None:
+    async with _llm_semaphore():
+        stream = Runner.run_streamed(agent, prompt)
+        await _process_stream_events(stream, buf, citations, seen)
+
+
+async def _run(agent: Agent, prompt: str) -> object:
+    async with _llm_semaphore():
+        run_result = await Runner.run(agent, prompt)
+    return run_result.final_output
+
+
 async def execute_agent(
-    agent_name: str, 
-    model: str, 
-    instructions: str, 
-    prompt: str, 
-    output_type=None, 
-    tools=None,
+    agent_name: str,
+    model: str,
+    instructions: str,
+    prompt: str,
+    *,
+    output_type: type[Any] | AgentOutputSchemaBase | None = None,
+    tools: list[Tool] | None = None,
     stream_citations: bool = False,
     **kwargs,
 ) -> dict[str, object]:
-    
     agent = _create_agent(
         name=agent_name,
         model=model, 
@@ -90,8 +130,7 @@ async def execute_agent(
         
         for attempt in range(3):
             try:
-                stream = Runner.run_streamed(agent, prompt)
-                await _process_stream_events(stream, buf, citations, seen)
+                await _run_streamed(agent, prompt, buf, citations, seen)
                 text_output = "".join(buf).strip()
                 return {"text": text_output, "citations": citations, "model": model, "version": "v1"}
             except openai.BadRequestError as e:
@@ -101,8 +140,7 @@ async def execute_agent(
                         name=agent_name, model=model, instructions=instructions,
                         output_type=output_type, tools=tools, temperature=False, **kwargs,
                     )
-                    stream = Runner.run_streamed(agent_no_temp, prompt)
-                    await _process_stream_events(stream, buf, citations, seen)
+                    await _run_streamed(agent_no_temp, prompt, buf, citations, seen)
                     text_output = "".join(buf).strip()
                     return {"text": text_output, "citations": citations, "model": model, "version": "v1"}
                 raise
@@ -115,12 +153,11 @@ async def execute_agent(
                 citations.clear()
                 seen.clear()
     
+    # Only the final structured output is needed here, so use the non-streaming
+    # runner instead of draining (and discarding) every stream event.
     for attempt in range(3):
         try:
-            stream = Runner.run_streamed(agent, prompt)
-            async for _ in stream.stream_events():
-                pass
-            output = stream.final_output
+            output = await _run(agent, prompt)
             break
         except openai.BadRequestError as e:
             if "temperature" in str(e) and "not supported" in str(e):
@@ -129,10 +166,7 @@ async def execute_agent(
                     name=agent_name, model=model, instructions=instructions,
                     output_type=output_type, tools=tools, temperature=False, **kwargs,
                 )
-                stream = Runner.run_streamed(agent_no_temp, prompt)
-                async for _ in stream.stream_events():
-                    pass
-                output = stream.final_output
+                output = await _run(agent_no_temp, prompt)
                 break
             raise
         except Exception as e:
@@ -278,6 +312,7 @@ async def stream_text_and_citations(agent: Agent, prompt: str) -> dict[str, obje
     )
 
 
+@lru_cache(maxsize=8)
 def make_clinical_reasoning_agent(model: str) -> Agent:
     return _create_agent(
         name="UTI Doctor Agent (Clinical Reasoning)",
@@ -301,12 +336,13 @@ def make_clinical_reasoning_agent(model: str) -> Agent:
         ),
         output_type=AgentOutputSchema(
             ClinicalReasoningOutput,
-            strict_json_schema=False,
+            strict_json_schema=True,
         ),
         tools=[WebSearchTool()],
     )
 
 
+@lru_cache(maxsize=8)
 def make_safety_validation_agent(model: str) -> Agent:
     return _create_agent(
         name="Clinical Pharmacist Safety Agent",
@@ -336,11 +372,12 @@ def make_safety_validation_agent(model: str) -> Agent:
             "- Generate detailed rationale explaining the clinical reasoning behind your safety assessment and recommendation\n"
             "- Use evidence-based sources and current clinical guidelines to support all safety recommendations"
         ),
-        output_type=AgentOutputSchema(SafetyValidationOutput, strict_json_schema=False),
+        output_type=AgentOutputSchema(SafetyValidationOutput, strict_json_schema=True),
         tools=[WebSearchTool()],
     )
 
 
+@lru_cache(maxsize=8)
 def make_research_agent(model: str) -> Agent:
     return _create_agent(
         name="Web Evidence Synthesis Agent",
@@ -369,6 +406,7 @@ def make_research_agent(model: str) -> Agent:
     )
 
 
+@lru_cache(maxsize=8)
 def make_diagnosis_agent(model: str) -> Agent:
     return _create_agent(
         name="UTI Diagnosis Report Agent",
@@ -396,6 +434,7 @@ def make_diagnosis_agent(model: str) -> Agent:
     )
 
 
+@lru_cache(maxsize=8)
 def make_claim_extractor_agent(model: str) -> Agent:
     return _create_agent(
         name="Claims & Citations Extractor",
@@ -415,33 +454,29 @@ def make_claim_extractor_agent(model: str) -> Agent:
             "- Maintain source context to preserve clinical meaning and applicability"
             "- Ensure all citations include proper attribution with title, URL, and relevance documentation"
         ),
-        output_type=AgentOutputSchema(ClaimExtractionOutput, strict_json_schema=False),
+        output_type=AgentOutputSchema(ClaimExtractionOutput, strict_json_schema=True),
     )
 
 
-def make_verifier_agent(model: str) -> Agent:
+@lru_cache(maxsize=8)
+def make_verifier_claims_agent(model: str) -> Agent:
     return _create_agent(
-        name="Plan Verification Agent",
+        name="Plan Verification & Claims Agent",
         model=model,
         instructions=(
-            "You are a senior clinical quality assurance specialist with extensive experience in care plan validation, clinical decision support system oversight, "
-            "and multi-disciplinary healthcare team coordination. Your role is to ensure coherence and safety across complex clinical assessments.\n\n"
+            "You are a senior clinical quality assurance specialist and clinical evidence analyst. "
+            "In a single pass you verify the coherence and safety of a complex clinical assessment and extract its clinical claims with citations.\n\n"
             "VERIFICATION RESPONSIBILITIES:\n"
-            "- Perform systematic cross-validation of assessment components (deterministic algorithm, clinical reasoning, safety validation, diagnosis)"
-            "- Identify logical contradictions between different assessment elements that could compromise patient safety or care quality"
-            "- Evaluate evidence support for all clinical claims and recommendations to ensure appropriate grounding"
-            "- Assess alignment between algorithmic decisions and clinical judgment recommendations\n\n"
-            "QUALITY ASSURANCE PROTOCOL:\n"
-            "- Review consistency between safety recommendations and proposed treatment plans"
-            "- Validate that contraindications identified by safety screening are appropriately addressed in final recommendations"
-            "- Ensure that all clinical claims are supported by adequate evidence or clearly identified as clinical judgment"
-            "- Check for internal consistency within reasoning chains and recommendation sets\n\n"
-            "REPORTING STANDARDS:\n"
-            "- Return strictly valid VerificationReport JSON with comprehensive issue documentation"
-            "- Provide detailed contradiction analysis with specific component references"
-            "- Identify unsupported claims with recommendations for evidence strengthening"
-            "- Generate overall verdict (pass, needs_review, fail) with detailed justification"
-            "- Include severity assessment for identified issues and specific remediation recommendations"
+            "- Cross-validate assessment components (deterministic algorithm, clinical reasoning, safety validation, diagnosis)"
+            "- Identify logical contradictions that could compromise patient safety or care quality"
+            "- Validate that contraindications identified by safety screening are addressed in final recommendations"
+            "- Generate overall verdict (pass, needs_review, fail) with severity assessment for identified issues\n\n"
+            "EXTRACTION METHODOLOGY:\n"
+            "- Identify factual claims, recommendations, and clinical assertions from the same assessment"
+            "- Map each claim to its supporting evidence sources with a one-sentence relevance explanation"
+            "- Include evidence quality assessment for each claim (high, moderate, low, insufficient)\n\n"
+            "OUTPUT STANDARDS:\n"
+            "- Return strictly valid VerificationClaimsOutput JSON with both verification_report and claims_with_citations populated"
         ),
-        output_type=AgentOutputSchema(VerificationReport, strict_json_schema=False),
+        output_type=AgentOutputSchema(VerificationClaimsOutput, strict_json_schema=True),
     )
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import logging
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import orjson
+import redis.asyncio as aioredis
+
+from .utils import llm_cache_enabled, llm_cache_ttl_s
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# Arguments derived from others (the parsed patient) must not split the key
+_UNKEYED_ARGS = frozenset({"patient"})
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+
+
+@lru_cache(maxsize=1)
+def _redis_client() -> aioredis.Redis:
+    url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    return aioredis.Redis.from_url(url, decode_responses=True)
+
+
+def _cache_key(name: str, bound: inspect.BoundArguments) -> str:
+    keyed = {k: v for k, v in bound.arguments.items() if k not in _UNKEYED_ARGS}
+    payload = orjson.dumps(
+        keyed,
+        default=str,
+        option=_ORJSON_OPTS | orjson.OPT_SORT_KEYS,
+    )
+    digest = hashlib.blake2b(name.encode() + b":" + payload, digest_size=20)
+    return f"llmcache:{name}:{digest.hexdigest()}"
+
+
+def llm_cache(
+    ttl_s: int | None = None,
+) -> Callable[[Callable[..., Awaitable[dict]]], Callable[..., Awaitable[dict]]]:
+    """Cache an async LLM-backed service in Redis, keyed on its arguments.
+
+    Disabled unless LLM_CACHE_ENABLED is set. Redis failures fall through to
+    the wrapped call so the cache can never fail an assessment.
+    """
+
+    def decorator(fn: Callable[..., Awaitable[dict]]) -> Callable[..., Awaitable[dict]]:
+        sig = inspect.signature(fn)
+        name = fn.__name__
+
+        @functools.wraps(fn)
+        async def wrapper(*args: object, **kwargs: object) -> dict:
+            if not llm_cache_enabled():
+                return await fn(*args, **kwargs)
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = _cache_key(name, bound)
+            client = _redis_client()
+            try:
+                cached = await client.get(key)
+            except Exception as e:
+                logger.warning(f"LLM cache read failed for {name}: {e}")
+                cached = None
+            if cached is not None:
+                return orjson.loads(cached)
+            result = await fn(*args, **kwargs)
+            try:
+                await client.setex(
+                    key,
+                    ttl_s or llm_cache_ttl_s(),
+                    orjson.dumps(result, default=str, option=_ORJSON_OPTS),
+                )
+            except Exception as e:
+                logger.warning(f"LLM cache write failed for {name}: {e}")
+            return result
+
+        return wrapper
+
+    return decorator
@@ -9,6 +9,8 @@ from agents import set_default_openai_client, set_trace_processors
 from openai import AsyncOpenAI
 from weave.integrations.openai_agents.openai_agents import WeaveTracingProcessor
 
+from .utils import apply_trace_sampling
+
 _client: AsyncOpenAI | None = None
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,7 @@ def ensure_openai_client(timeout: float = 600.0) -> bool:
     project_name = os.getenv("WEAVE_PROJECT", "uti-cli-agents")
     if os.getenv("WEAVE_DISABLE_INIT", "0") != "1":
         weave.init(project_name)
+        apply_trace_sampling()
         set_trace_processors([WeaveTracingProcessor()])
         logger.info(f"Weave tracing initialized for project: {project_name}")
 
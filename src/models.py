@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 from typing import NamedTuple
@@ -102,15 +103,64 @@ class RecurrenceResult(NamedTuple):
     reason: str
 
 
+class RegimenFlags(NamedTuple):
+    """Regimen text signals scanned once per validation"""
+
+    present: bool
+    nitrofurantoin: bool
+    tmp_smx: bool
+    trimethoprim: bool
+    fosfomycin: bool
+    five_days: bool
+    three_days: bool
+    fosfomycin_3g: bool
+
+    @classmethod
+    def from_text(cls, regimen_text: str) -> "RegimenFlags":
+        rt = regimen_text.lower()
+        return cls(
+            present=bool(rt) and rt != "none",
+            nitrofurantoin="nitrofurantoin" in rt,
+            tmp_smx="tmp" in rt or "sulfamethoxazole" in rt or "smx" in rt,
+            trimethoprim="trimethoprim" in rt,
+            fosfomycin="fosfomycin" in rt,
+            five_days="x 5" in rt,
+            three_days="x 3" in rt,
+            fosfomycin_3g="3 g" in rt or "3g" in rt,
+        )
+
+
+class RuleContext(NamedTuple):
+    """Inputs shared by every state validator rule, normalized once per call"""
+
+    patient: "PatientState"
+    regimen: RegimenFlags
+    approval: str
+    allergies: tuple[str, ...]
+
+
+class ValidationRule(NamedTuple):
+    """State validator rule; applies(context) decides if it fires"""
+
+    applies: Callable[[RuleContext], bool]
+    rule_name: str
+    severity: str = "moderate"
+    is_contradiction: bool = False
+
+
 # Clinical constants for UTI algorithm
-PREGNANCY_EXCLUSIONS = {
-    PregnancyStatus.no,
-    PregnancyStatus.not_pregnant,
-    PregnancyStatus.not_applicable,
-    PregnancyStatus.unknown,
-}
-TMP_SMX_ALLERGY_TERMS = {"tmp/smx", "trimethoprim", "sulfamethoxazole", "sulfonamides"}
-REJECT_TERMS = {"reject", "do not start", "refer_no_antibiotics"}
+PREGNANCY_EXCLUSIONS = frozenset(
+    {
+        PregnancyStatus.no,
+        PregnancyStatus.not_pregnant,
+        PregnancyStatus.not_applicable,
+        PregnancyStatus.unknown,
+    },
+)
+TMP_SMX_ALLERGY_TERMS = frozenset(
+    {"tmp/smx", "trimethoprim", "sulfamethoxazole", "sulfonamides"},
+)
+REJECT_TERMS = frozenset({"reject", "do not start", "refer_no_antibiotics"})
 
 # Treatment specifications (immutable clinical data)
 TREATMENT_OPTIONS = {
@@ -421,6 +471,15 @@ class AssessmentOutput(BaseModel):
 # ===== Agents SDK Structured Outputs =====
 
 
+class Citation(BaseModel):
+    title: str = Field(default="", description="Title of the cited source.")
+    url: str = Field(default="", description="URL of the cited source.")
+    relevance: str = Field(
+        default="",
+        description="One sentence on how the source supports the statement.",
+    )
+
+
 class ClinicalReasoningOutput(BaseModel):
     reasoning: list[str] = Field(
         default_factory=list,
@@ -452,7 +511,7 @@ class ClinicalReasoningOutput(BaseModel):
         default_factory=list,
         description="Antimicrobial stewardship notes: spectrum, duration, resistance, interactions.",
     )
-    citations: list[dict] = Field(
+    citations: list[Citation] = Field(
         default_factory=list,
         description="List of citations; each item includes {title, url, relevance}.",
     )
@@ -514,7 +573,7 @@ class SafetyValidationOutput(BaseModel):
         default=None,
         description="Brief reasoning for the approval recommendation and risk level.",
     )
-    citations: list[dict] = Field(
+    citations: list[Citation] = Field(
         default_factory=list,
         description="List of citations; each item includes {title, url, relevance}.",
     )
@@ -614,19 +673,32 @@ class Claim(BaseModel):
         default="",
         description="Context from which this claim was extracted.",
     )
-    citations: list[dict] = Field(
+    citations: list[Citation] = Field(
         default_factory=list,
         description="Citations supporting this claim with title, url, and relevance.",
     )
 
 
+class ExtractionMetadata(BaseModel):
+    confidence: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Extractor confidence that the claims cover the assessment.",
+    )
+    coverage_notes: str = Field(
+        default="",
+        description="Sections that yielded no claims or lacked supporting sources.",
+    )
+
+
 class ClaimExtractionOutput(BaseModel):
     claims: list[Claim] = Field(
         default_factory=list,
         description="List of extracted claims with their supporting citations.",
     )
-    extraction_metadata: dict = Field(
-        default_factory=dict,
+    extraction_metadata: ExtractionMetadata = Field(
+        default_factory=ExtractionMetadata,
         description="Metadata about the extraction process including confidence and coverage.",
     )
 
@@ -677,3 +749,14 @@ class VerificationReport(BaseModel):
         le=1.0,
         description="Overall confidence in the assessment coherence.",
     )
+
+
+class VerificationClaimsOutput(BaseModel):
+    verification_report: VerificationReport = Field(
+        ...,
+        description="Cross-component verification of the final assessment snapshot.",
+    )
+    claims_with_citations: ClaimExtractionOutput = Field(
+        default_factory=ClaimExtractionOutput,
+        description="Claims extracted from the same snapshot with supporting citations.",
+    )
@@ -66,6 +66,11 @@ COMPREHENSIVE ANALYSIS REQUIREMENTS:
 - Include precise numeric confidence assessment with comprehensive rationale addressing evidence quality, clinical complexity, diagnostic certainty, and treatment appropriateness
 </DESCRIPTION>
 
+<TASK>
+Provide an expert clinical reasoning assessment as JSON using the specified keys. Ensure clinical_rationale bullets read as a cohesive narrative.
+Do not include any text outside the JSON object.
+</TASK>
+
 <PATIENT_DATA>
 Age: {patient.age} years
 Sex: {patient.sex.value}
@@ -100,11 +105,6 @@ Recurrence:
 - ≥2 UTIs in 6 months: {patient.recurrence.recurrent_6m}
 - ≥3 UTIs in 12 months: {patient.recurrence.recurrent_12m}
 </PATIENT_DATA>
-
-<TASK>
-Provide an expert clinical reasoning assessment as JSON using the specified keys. Ensure clinical_rationale bullets read as a cohesive narrative.
-Do not include any text outside the JSON object.
-</TASK>
 {assessment_block}
 </CLINICAL_REASONING_ASSESSMENT>
 """
@@ -149,6 +149,22 @@ def make_safety_validation_prompt(
 Perform comprehensive medication safety screening for the proposed UTI treatment plan.
 </DESCRIPTION>
 
+<SAFETY_SCREENING_TASKS>
+1. Contraindication screening (absolute and relative)
+2. Drug-drug interaction assessment
+3. Pregnancy and renal function appropriateness
+4. Age-related dosing considerations
+5. Monitoring requirements identification
+6. Overall risk stratification
+If the clinical decision indicates referral (e.g., contains "refer"), do not recommend initiating antibiotics.
+Return JSON only with keys: safety_flags[], contraindications[], drug_interactions[], monitoring_requirements[], risk_level, approval_recommendation, rationale
+Additional checks to consider:
+- TMP/SMX and ACEI/ARB (hyperkalemia risk)
+- Nitrofurantoin in late pregnancy or severe renal impairment
+- Fosfomycin use in pediatric patients
+- Significant CYP-mediated interactions with concurrent medications
+</SAFETY_SCREENING_TASKS>
+
 <PATIENT_SAFETY_PROFILE>
 Age: {patient.age} years
 Sex: {patient.sex.value}
@@ -168,22 +184,6 @@ Notes:
 - The assessment's recommendation provides algorithmic context only.
 </PROPOSED_TREATMENT>
 {doctor_block}
-
-<SAFETY_SCREENING_TASKS>
-1. Contraindication screening (absolute and relative)
-2. Drug-drug interaction assessment
-3. Pregnancy and renal function appropriateness
-4. Age-related dosing considerations
-5. Monitoring requirements identification
-6. Overall risk stratification
-If the clinical decision indicates referral (e.g., contains "refer"), do not recommend initiating antibiotics.
-Return JSON only with keys: safety_flags[], contraindications[], drug_interactions[], monitoring_requirements[], risk_level, approval_recommendation, rationale
-Additional checks to consider:
-- TMP/SMX and ACEI/ARB (hyperkalemia risk)
-- Nitrofurantoin in late pregnancy or severe renal impairment
-- Fosfomycin use in pediatric patients
-- Significant CYP-mediated interactions with concurrent medications
-</SAFETY_SCREENING_TASKS>
 </SAFETY_VALIDATION_ASSESSMENT>
 """
 
@@ -206,12 +206,6 @@ def make_web_research_prompt(query: str, region: str) -> str:
 Conduct focused research on UTI-related clinical evidence with emphasis on current guidelines and resistance patterns.
 </DESCRIPTION>
 
-<RESEARCH_PARAMETERS>
-Query: {query}
-Region: {region} (assume Canada/Ontario; prefer CA-ON sources and Canadian guidelines)
-Focus: Clinical evidence, treatment guidelines, resistance patterns
-</RESEARCH_PARAMETERS>
-
 <RESEARCH_GUIDELINES>
 - Prioritize recent, high-quality clinical evidence
 - Include specific resistance percentages when available
@@ -232,6 +226,12 @@ Provide a brief, factual, sectioned bullet summary:
 - Limitations (scope/data gaps)
 Include source attribution inline and ensure citations emitted in stream are deduplicated.
 </OUTPUT_FORMAT>
+
+<RESEARCH_PARAMETERS>
+Query: {query}
+Region: {region} (assume Canada/Ontario; prefer CA-ON sources and Canadian guidelines)
+Focus: Clinical evidence, treatment guidelines, resistance patterns
+</RESEARCH_PARAMETERS>
 </CLINICAL_RESEARCH_REQUEST>
 """
 
@@ -321,27 +321,6 @@ Follow-up plan: {assessment.follow_up if assessment.follow_up else "Standard UTI
 """
 
 
-def make_verifier_prompt(final_snapshot: dict) -> str:
-    try:
-        ctx = json.dumps(final_snapshot, ensure_ascii=False)
-    except Exception:
-        ctx = str(final_snapshot)
-    return f"""
-<PLAN_VERIFICATION>
-<INSTRUCTIONS>
-- Output strictly valid JSON with keys: contradictions[], unsupported_claims[], alignment_notes[], verdict.
-- verdict must be one of: pass, needs_review, fail.
-- Focus on alignment between deterministic assessment, safety approval, clinical reasoning, diagnosis recommendations.
-- Flag any recommendation that contradicts safety gating or algorithmic decision.
-- Identify claims without clear evidence support or citations.
-</INSTRUCTIONS>
-<CONTEXT>
-{ctx}
-</CONTEXT>
-</PLAN_VERIFICATION>
-"""
-
-
 def make_claim_extractor_prompt(final_snapshot: dict) -> str:
     try:
         ctx = json.dumps(final_snapshot, ensure_ascii=False)
@@ -405,3 +384,27 @@ Return ONLY the revised JSON object. If pharmacist indicates modify/conditional/
 </TASK>
 </CLINICAL_REASONING_REFINEMENT>
 """
+
+
+def make_verifier_claims_prompt(final_snapshot: dict) -> str:
+    try:
+        ctx = json.dumps(final_snapshot, ensure_ascii=False)
+    except Exception:
+        ctx = str(final_snapshot)
+    return f"""
+<PLAN_VERIFICATION_AND_CLAIMS>
+<INSTRUCTIONS>
+- Output strictly valid JSON with keys: verification_report, claims_with_citations.
+- verification_report: contradictions[], unsupported_claims[], alignment_notes[], verdict (one of: pass, needs_review, fail).
+- Focus on alignment between deterministic assessment, safety approval, clinical reasoning, diagnosis recommendations.
+- Flag any recommendation that contradicts safety gating or algorithmic decision.
+- Identify claims without clear evidence support or citations.
+- claims_with_citations: claims[] as defined by ClaimExtractionOutput, extracted from assessment.rationale, clinical_reasoning.reasoning/clinical_rationale, and diagnosis.
+- For each claim, map citation URLs from any captured citations; include a one-line relevance.
+- Deduplicate URLs across claims; if the same URL supports multiple claims, include it in each relevant claim.
+</INSTRUCTIONS>
+<CONTEXT>
+{ctx}
+</CONTEXT>
+</PLAN_VERIFICATION_AND_CLAIMS>
+"""
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from typing import TYPE_CHECKING
 
 import weave
 from pydantic import BaseModel
@@ -13,20 +14,20 @@ from .agents_research import (
     make_diagnosis_agent,
     make_research_agent,
     make_safety_validation_agent,
-    make_verifier_agent,
+    make_verifier_claims_agent,
     stream_text_and_citations,
 )
+from .cache import llm_cache
 from .models import (
     ApprovalDecision,
     AssessmentOutput,
-    AuditBundle,
     ConsensusLabel,
     Decision,
     InterruptStage,
     OrchestrationPath,
     PatientState,
-    Recommendation,
     SectionStatus,
+    ValidatorResult,
 )
 from .prompts import (
     make_claim_extractor_prompt,
@@ -34,7 +35,7 @@ from .prompts import (
     make_diagnosis_xml_prompt,
     make_reasoning_refinement_prompt,
     make_safety_validation_prompt,
-    make_verifier_prompt,
+    make_verifier_claims_prompt,
     make_web_research_prompt,
 )
 from .uti_algo import (
@@ -44,17 +45,52 @@ from .uti_algo import (
     state_validator,
 )
 from .utils import (
+    audit_bundle_enabled,
     doctor_summary_on_referral_enabled,
+    doctor_summary_require_llm,
+    parallel_safety_screen_enabled,
     parse_approval,
     parse_decision,
     prescriber_signoff_required,
+    register_traced_ops,
     safe_model_dump,
     should_verify,
     strict_interrupts_enabled,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 logger = logging.getLogger(__name__)
 
+_REFERRAL_DECISIONS = frozenset({Decision.refer_complicated, Decision.refer_recurrence})
+_APPROVAL_INTERRUPT = frozenset(
+    {
+        ApprovalDecision.reject,
+        ApprovalDecision.do_not_start,
+        ApprovalDecision.deny,
+        ApprovalDecision.refer_no_antibiotics,
+    },
+)
+_APPROVAL_REFINE = frozenset(
+    {
+        ApprovalDecision.modify,
+        ApprovalDecision.conditional,
+        ApprovalDecision.reject,
+        ApprovalDecision.do_not_start,
+        ApprovalDecision.refer_no_antibiotics,
+    },
+)
+_APPROVAL_MODIFY = frozenset({ApprovalDecision.modify, ApprovalDecision.conditional})
+_APPROVAL_DEFER = frozenset(
+    {ApprovalDecision.reject, ApprovalDecision.do_not_start, ApprovalDecision.deny},
+)
+_REGIONAL_RESEARCH_QUERY = (
+    "Latest regional resistance and any UTI guideline updates (concise)"
+)
+_CONSIDERATION_PREFIXES = ("Patient-specific:", "Current resistance intelligence:")
+_BULLET = "\n• "
+
 
 class PatientContext(BaseModel):
     patient_data: dict[str, object]
@@ -62,10 +98,16 @@ class PatientContext(BaseModel):
     assessment: AssessmentOutput | None = None
     
     @classmethod
-    def from_patient_data(cls, patient_data: dict[str, object]) -> PatientContext:
+    def from_patient_data(
+        cls,
+        patient_data: dict[str, object],
+        patient: PatientState | None = None,
+        assessment: AssessmentOutput | None = None,
+    ) -> PatientContext:
         return cls(
             patient_data=patient_data,
-            patient_state=PatientState(**patient_data),
+            patient_state=patient if patient is not None else PatientState(**patient_data),
+            assessment=assessment,
         )
     
     def get_assessment(self) -> AssessmentOutput:
@@ -74,20 +116,43 @@ class PatientContext(BaseModel):
         return self.assessment
 
 
-def _section_sentinel(status: SectionStatus, reason: str, stage: str | None = None) -> dict:
-    s = str(status.value if hasattr(status, "value") else status)
-    out = {"status": s, "reason": reason, "version": "v1"}
+def _bulleted(items: Iterable[object]) -> str:
+    return "• " + _BULLET.join(map(str, items))
+
+
+def _section_sentinel(
+    status: SectionStatus, reason: str, stage: InterruptStage | None = None,
+) -> dict:
+    out = {"status": status.value, "reason": reason, "version": "v1"}
     if stage is not None:
-        out["stage"] = stage
+        out["stage"] = stage.value
     return out
 
 
+def _template_doctor_summary(assessment_details: dict) -> dict:
+    decision = assessment_details.get("decision")
+    decision_text = str(getattr(decision, "value", decision) or "unknown")
+    rationale = assessment_details.get("rationale") or []
+    return {
+        "narrative": f"Deterministic decision: {decision_text}. Rationale: {'; '.join(rationale)}.",
+        "confidence": 1.0,
+        "reasoning": rationale,
+    }
+
+
 async def _maybe_doctor_summary(
-    patient_data: dict, model: str, assessment_details: dict,
+    patient_data: dict,
+    model: str,
+    assessment_details: dict,
+    patient: PatientState | None = None,
 ) -> dict | None:
     if not doctor_summary_on_referral_enabled():
         return None
-    doc_out = await clinical_reasoning(patient_data, model, assessment_details)
+    if not doctor_summary_require_llm():
+        return _template_doctor_summary(assessment_details)
+    doc_out = await clinical_reasoning(
+        patient_data, model, assessment_details, patient=patient,
+    )
     if not isinstance(doc_out, dict):
         return {"narrative": "Summary unavailable.", "confidence": 0.0, "reasoning": []}
     return {
@@ -97,9 +162,47 @@ async def _maybe_doctor_summary(
     }
 
 
+async def _reason_and_screen(
+    patient_data: dict,
+    model: str,
+    *,
+    assessment_result: dict,
+    assessment_details: dict,
+    patient: PatientState,
+) -> tuple[dict, dict]:
+    decision = Decision.recommend_treatment.value
+    recommendation = assessment_result.get("recommendation")
+    if not parallel_safety_screen_enabled():
+        clinical_result = await clinical_reasoning(
+            patient_data, model, assessment_details, patient=patient,
+        )
+        safety_result = await safety_validation(
+            patient_data,
+            decision,
+            recommendation,
+            model,
+            clinical_reasoning_context=clinical_result,
+            patient=patient,
+        )
+        return clinical_result, safety_result
+    # Screen the deterministic recommendation while the doctor agent reasons;
+    # the pharmacist does not see the doctor's reasoning.
+    safety_task = asyncio.create_task(
+        safety_validation(patient_data, decision, recommendation, model, patient=patient),
+    )
+    try:
+        clinical_result = await clinical_reasoning(
+            patient_data, model, assessment_details, patient=patient,
+        )
+        return clinical_result, await safety_task
+    finally:
+        # A no-op once awaited; stops the screen if clinical reasoning failed
+        safety_task.cancel()
+
+
 def _build_output(
     *,
-    path: str,
+    path: OrchestrationPath,
     assessment: dict,
     clinical_reasoning: dict | None,
     safety_validation: dict | None,
@@ -112,13 +215,14 @@ def _build_output(
     model: str,
     patient_inputs: dict,
     human_escalation: bool,
-    interrupt_stage: str | None = None,
+    interrupt_stage: InterruptStage | None = None,
     verification_report: dict | None = None,
     claims_with_citations: dict | None = None,
+    include_audit: bool = True,
 ) -> dict:
     out = {
         "orchestration": "final_consolidated",
-        "orchestration_path": path if isinstance(path, str) else str(path),
+        "orchestration_path": path.value,
         "clinical_reasoning": clinical_reasoning,
         "assessment": assessment,
         "safety_validation": safety_validation,
@@ -136,43 +240,48 @@ def _build_output(
         "improvements": [],
         "human_escalation": human_escalation,
     }
-    if interrupt_stage:
-        out["interrupt_stage"] = (
-            interrupt_stage
-            if isinstance(interrupt_stage, str)
-            else str(interrupt_stage)
-        )
-    audit = AuditBundle(
-        assessment=assessment,
-        clinical_reasoning=clinical_reasoning,
-        validator=validator,
-        safety_validation=safety_validation,
-        prescribing_considerations=presc,
-        research_context=research,
-        diagnosis=diagnosis,
-        consensus_recommendation=consensus,
-        verification_report=verification_report,
-        claims_with_citations=safe_model_dump(claims_with_citations),
-        inputs=patient_inputs,
-    )
-    out["audit_bundle"] = audit.model_dump()
+    if interrupt_stage is not None:
+        out["interrupt_stage"] = interrupt_stage.value
+    if not include_audit:
+        return out
+    # Inputs are already validated upstream; reuse the references instead of an
+    # AuditBundle round-trip (use AuditBundle.model_construct for a typed view).
+    out["audit_bundle"] = {
+        "assessment": assessment,
+        "clinical_reasoning": clinical_reasoning,
+        "validator": validator,
+        "safety_validation": safety_validation,
+        "prescribing_considerations": presc,
+        "research_context": research,
+        "diagnosis": diagnosis,
+        "consensus_recommendation": consensus,
+        "verification_report": verification_report,
+        "claims_with_citations": safe_model_dump(claims_with_citations),
+        "inputs": patient_inputs,
+    }
     return out
 
 
 @weave.op(name="state_validator_op")
 def state_validator_op(
-    patient_data: dict, regimen_text: str, safety: dict | None,
-) -> dict:
-    context = PatientContext.from_patient_data(patient_data)
-    val = state_validator(context.patient_state, regimen_text, safety)
-    return safe_model_dump(val)
+    patient_data: dict,
+    regimen_text: str,
+    safety: dict | None,
+    patient: PatientState | None = None,
+) -> ValidatorResult:
+    context = PatientContext.from_patient_data(patient_data, patient)
+    return state_validator(context.patient_state, regimen_text, safety)
 
 
 @weave.op(name="clinical_reasoning")
+@llm_cache()
 async def clinical_reasoning(
-    patient_data: dict, model: str = "gpt-4.1", assessment_details: dict | None = None,
+    patient_data: dict,
+    model: str = "gpt-4.1",
+    assessment_details: dict | None = None,
+    patient: PatientState | None = None,
 ) -> dict:
-    context = PatientContext.from_patient_data(patient_data)
+    context = PatientContext.from_patient_data(patient_data, patient)
     prompt = make_clinical_reasoning_prompt(context.patient_state, assessment_details)
     agent = make_clinical_reasoning_agent(model)
     out = await execute_agent(
@@ -183,35 +292,28 @@ async def clinical_reasoning(
         output_type=agent.output_type,
         tools=agent.tools,
     )
-    result: dict[str, object] = {"model": model, "version": "v1"}
-    if hasattr(out, "model_dump"):
-        data = out.model_dump()
-        result.update(data)
-        if hasattr(out, "as_narrative"):
-            result["narrative"] = out.as_narrative()
-    elif isinstance(out, dict):
-        result.update(out)
-        if "narrative" not in result:
-            reasoning = result.get("reasoning") or []
-            if isinstance(reasoning, list) and reasoning:
-                lines = "\n".join([f"• {r}" for r in reasoning])
-                result["narrative"] = f"Key reasoning:\n{lines}"
-            else:
-                result["narrative"] = "Clinical reasoning completed."
-    else:
-        result["narrative"] = "Clinical reasoning completed."
+    # execute_agent already returns the dumped output with its narrative
+    result: dict[str, object] = {"model": model, "version": "v1", **out}
+    if "narrative" not in result:
+        reasoning = result.get("reasoning") or []
+        if isinstance(reasoning, list) and reasoning:
+            result["narrative"] = f"Key reasoning:\n{_bulleted(reasoning)}"
+        else:
+            result["narrative"] = "Clinical reasoning completed."
     return result
 
 
 @weave.op(name="safety_validation")
+@llm_cache()
 async def safety_validation(
     patient_data: dict,
     decision: str,
     recommendation: dict | None,
     model: str = "gpt-4.1",
     clinical_reasoning_context: dict | None = None,
+    patient: PatientState | None = None,
 ) -> dict:
-    context = PatientContext.from_patient_data(patient_data)
+    context = PatientContext.from_patient_data(patient_data, patient)
     rec_text = "None"
     if isinstance(recommendation, dict) and recommendation:
         parts = [
@@ -245,22 +347,13 @@ async def safety_validation(
         output_type=agent.output_type,
         tools=agent.tools,
     )
-    result: dict[str, object] = {"model": model, "version": "v1"}
-    if hasattr(out, "model_dump"):
-        data = out.model_dump()
-        result.update(data)
-        if hasattr(out, "as_narrative"):
-            result["narrative"] = out.as_narrative()
-    elif isinstance(out, dict):
-        result.update(out)
-        if "narrative" not in result:
-            result["narrative"] = "Safety screen complete."
-    else:
-        result["narrative"] = "Safety screen complete."
+    result: dict[str, object] = {"model": model, "version": "v1", **out}
+    result.setdefault("narrative", "Safety screen complete.")
     return result
 
 
 @weave.op(name="web_research")
+@llm_cache()
 async def web_research(query: str, region: str, model: str = "gpt-4.1") -> dict:
     prompt = make_web_research_prompt(query, region)
     agent = make_research_agent(model)
@@ -280,9 +373,13 @@ async def web_research(query: str, region: str, model: str = "gpt-4.1") -> dict:
 
 @weave.op(name="prescribing_considerations")
 async def prescribing_considerations(
-    patient_data: dict, region: str, model: str = "gpt-4.1",
+    patient_data: dict,
+    region: str,
+    model: str = "gpt-4.1",
+    patient: PatientState | None = None,
+    resistance_research: dict | None = None,
 ) -> dict:
-    context = PatientContext.from_patient_data(patient_data)
+    context = PatientContext.from_patient_data(patient_data, patient)
     
     # Delegate to research agent to synthesize considerations; avoid duplicated constants
     considerations: list[str] = []
@@ -291,26 +388,25 @@ async def prescribing_considerations(
     if contraindications:
         considerations.extend([f"Patient-specific: {ci}" for ci in contraindications])
     
-    # Get research data
-    extra = await web_research(
-        "Latest regional resistance and any UTI guideline updates (concise)",
-        region,
-        model,
+    # Get research data (the orchestrator may have fetched it concurrently)
+    extra = (
+        resistance_research
+        if resistance_research is not None
+        else await web_research(_REGIONAL_RESEARCH_QUERY, region, model)
     )
     if extra.get("summary"):
         considerations.append(f"Current resistance intelligence: {extra['summary']}")
     
-    citations = list(extra.get("citations", []))
+    citations = extra.get("citations") or []
     
     # Format considerations
-    formatted_considerations = []
-    for consideration in considerations:
-        if not consideration.startswith(("Patient-specific:", "Current resistance intelligence:")):
-            formatted_considerations.append(f"• {consideration}")
-        else:
-            formatted_considerations.append(f"\n{consideration}")
-    
-    narrative = "Prescribing Considerations:\n\n" + "\n".join(formatted_considerations)
+    formatted_considerations = "\n".join(
+        f"\n{consideration}"
+        if consideration.startswith(_CONSIDERATION_PREFIXES)
+        else f"• {consideration}"
+        for consideration in considerations
+    )
+    narrative = "Prescribing Considerations:\n\n" + formatted_considerations
     return {
         "considerations": considerations,
         "region": region,
@@ -322,13 +418,15 @@ async def prescribing_considerations(
 
 
 @weave.op(name="deep_research_diagnosis")
+@llm_cache()
 async def deep_research_diagnosis(
     patient_data: dict,
     model: str = "gpt-4.1",
     doctor_reasoning: dict | None = None,
     safety_validation_context: dict | None = None,
+    patient: PatientState | None = None,
 ) -> dict:
-    context = PatientContext.from_patient_data(patient_data)
+    context = PatientContext.from_patient_data(patient_data, patient)
     assessment = context.get_assessment()
     xml = make_diagnosis_xml_prompt(
         context.patient_state, assessment, doctor_reasoning, safety_validation_context,
@@ -348,13 +446,17 @@ async def deep_research_diagnosis(
 
 
 @weave.op(name="assess_and_plan")
-async def assess_and_plan(patient_data: dict) -> dict:
-    context = PatientContext.from_patient_data(patient_data)
+async def assess_and_plan(
+    patient_data: dict,
+    patient: PatientState | None = None,
+    assessment: AssessmentOutput | None = None,
+) -> dict:
+    context = PatientContext.from_patient_data(patient_data, patient, assessment)
     result = context.get_assessment()
     rd = safe_model_dump(result)
     decision = rd.get("decision", "unknown")
-    rec_obj = rd.get("recommendation")
-    rec_text = Recommendation(**rec_obj).as_text() if rec_obj else "None"
+    # Render from the typed recommendation rather than re-validating its dump
+    rec_text = result.recommendation.as_text() if result.recommendation else "None"
     rationale = rd.get("rationale", [])
     follow_up = rd.get("follow_up")
 
@@ -371,19 +473,21 @@ async def assess_and_plan(patient_data: dict) -> dict:
 
 
 @weave.op(name="follow_up_plan")
-async def follow_up_plan(patient_data: dict) -> dict:
-    context = PatientContext.from_patient_data(patient_data)
-    plan_details = get_enhanced_follow_up_plan(context.patient_state)
+async def follow_up_plan(
+    patient_data: dict,
+    patient: PatientState | None = None,
+    assessment: AssessmentOutput | None = None,
+) -> dict:
+    context = PatientContext.from_patient_data(patient_data, patient)
+    plan_details = get_enhanced_follow_up_plan(context.patient_state, assessment)
 
     narrative_parts = ["72-hour follow-up plan prepared."]
     monitoring = plan_details.get("monitoring_checklist", [])
     special_instructions = plan_details.get("special_instructions", [])
     if monitoring:
-        monitoring_formatted = "\n".join([f"• {item}" for item in monitoring])
-        narrative_parts.append(f"Monitoring:\n{monitoring_formatted}")
+        narrative_parts.append(f"Monitoring:\n{_bulleted(monitoring)}")
     if special_instructions:
-        special_formatted = "\n".join([f"• {item}" for item in special_instructions])
-        narrative_parts.append(f"Special Instructions:\n{special_formatted}")
+        narrative_parts.append(f"Special Instructions:\n{_bulleted(special_instructions)}")
     narrative = " \n".join(narrative_parts)
     return {
         **plan_details,
@@ -394,29 +498,42 @@ async def follow_up_plan(patient_data: dict) -> dict:
 
 @weave.op(name="uti_complete_patient_assessment")
 async def uti_complete_patient_assessment(
-    patient_data: dict, model: str = "gpt-4.1",
+    patient_data: dict,
+    model: str = "gpt-4.1",
+    *,
+    include_audit: bool | None = None,
 ) -> dict:
+    if include_audit is None:
+        include_audit = audit_bundle_enabled()
+    # Validate patient_data once and share the PatientState with every stage.
     context = PatientContext.from_patient_data(patient_data)
-    assessment_result = await assess_and_plan(patient_data)
-    
+    patient = context.patient_state
+    # Run the deterministic algorithm once and share it with both stages.
+    assessment = context.get_assessment()
+    assessment_result = await assess_and_plan(
+        patient_data, patient=patient, assessment=assessment,
+    )
+
+    # Leave out the audit block: its timestamp changes on every call and would
+    # split the LLM cache key of every stage that sees these details.
     assessment_details = {
         "decision": assessment_result.get("decision"),
         "recommendation": assessment_result.get("recommendation"),
         "rationale": assessment_result.get("rationale", []),
         "follow_up": assessment_result.get("follow_up"),
-        "audit": assessment_result.get("audit", {}),
     }
 
     decision = parse_decision(
         assessment_result.get("decision", Decision.no_antibiotics_not_met),
     )
 
-    if strict_interrupts_enabled() and decision in {
-        Decision.refer_complicated,
-        Decision.refer_recurrence,
-    }:
+    # Resolve the routing inputs once; every gate below branches on these.
+    strict = strict_interrupts_enabled()
+    treatment_path = decision == Decision.recommend_treatment
+
+    if strict and decision in _REFERRAL_DECISIONS:
         doctor_summary = await _maybe_doctor_summary(
-            patient_data, model, assessment_details,
+            patient_data, model, assessment_details, patient=patient,
         )
         return _build_output(
             path=OrchestrationPath.deterministic_interrupt,
@@ -461,6 +578,7 @@ async def uti_complete_patient_assessment(
             ),
             model=model,
             patient_inputs=patient_data,
+            include_audit=include_audit,
             human_escalation=True,
             interrupt_stage=InterruptStage.deterministic_gate,
             verification_report=_section_sentinel(
@@ -475,89 +593,23 @@ async def uti_complete_patient_assessment(
             ),
         )
 
-    if decision == Decision.recommend_treatment:
-        clinical_result = await clinical_reasoning(
-            patient_data, model, assessment_details,
-        )
-    else:
-        if strict_interrupts_enabled():
-            doctor_summary = await _maybe_doctor_summary(
-                patient_data, model, assessment_details,
-            )
-            return _build_output(
-                path=OrchestrationPath.deterministic_no_rx,
-                assessment=assessment_result,
-                clinical_reasoning=doctor_summary
-                or {"reasoning": ["No antibiotics per algorithm"], "confidence": 1.0},
-                safety_validation=_section_sentinel(
-                    SectionStatus.not_applicable,
-                    "Safety validation only runs for treatment pathways",
-                    InterruptStage.deterministic_gate,
-                ),
-                presc=_section_sentinel(
-                    SectionStatus.not_applicable,
-                    "Prescribing considerations are only generated for treatment pathways",
-                    InterruptStage.deterministic_gate,
-                ),
-                research=_section_sentinel(
-                    SectionStatus.skipped,
-                    "Skipped for deterministic no-Rx path",
-                    InterruptStage.deterministic_gate,
-                ),
-                diagnosis=_section_sentinel(
-                    SectionStatus.skipped,
-                    "Skipped for deterministic no-Rx path",
-                    InterruptStage.deterministic_gate,
-                ),
-                follow_up_details=_section_sentinel(
-                    SectionStatus.not_applicable,
-                    "Follow-up plan only generated for treatment pathways",
-                    InterruptStage.deterministic_gate,
-                ),
-                consensus=ConsensusLabel.no_antibiotics_or_refer.value,
-                validator=_section_sentinel(
-                    SectionStatus.skipped,
-                    "Validator not run for deterministic no-Rx path",
-                    InterruptStage.deterministic_gate,
-                ),
-                model=model,
-                patient_inputs=patient_data,
-                human_escalation=False,
-                verification_report=_section_sentinel(
-                    SectionStatus.skipped,
-                    "Verification not run for deterministic no-Rx path",
-                    InterruptStage.deterministic_gate,
-                ),
-                claims_with_citations=_section_sentinel(
-                    SectionStatus.skipped,
-                    "Claims extraction not run for deterministic no-Rx path",
-                    InterruptStage.deterministic_gate,
-                ),
-            )
-        clinical_result = {
-            "reasoning": ["Referral/no antibiotics per algorithm"],
-            "confidence": 1.0,
-        }
-
     safety_result = None
-    if decision == Decision.recommend_treatment:
-        safety_result = await safety_validation(
+    safety_approval = ApprovalDecision.undecided
+    if treatment_path:
+        clinical_result, safety_result = await _reason_and_screen(
             patient_data,
-            decision.value,
-            assessment_result.get("recommendation"),
             model,
-            clinical_reasoning_context=clinical_result,
+            assessment_result=assessment_result,
+            assessment_details=assessment_details,
+            patient=patient,
         )
 
-        sa = parse_approval(
-            (safety_result or {}).get("approval_recommendation", "undecided"),
-        )
-        if strict_interrupts_enabled() and sa in [
-            ApprovalDecision.reject,
-            ApprovalDecision.do_not_start,
-            ApprovalDecision.deny,
-            ApprovalDecision.refer_no_antibiotics,
-        ]:
+        # Parse the approval once; every later gate reuses it.
+        if isinstance(safety_result, dict):
+            safety_approval = parse_approval(
+                safety_result.get("approval_recommendation", "undecided"),
+            )
+        if strict and safety_approval in _APPROVAL_INTERRUPT:
             return _build_output(
                 path=OrchestrationPath.safety_interrupt,
                 assessment=assessment_result,
@@ -591,6 +643,7 @@ async def uti_complete_patient_assessment(
                 ),
                 model=model,
                 patient_inputs=patient_data,
+                include_audit=include_audit,
                 human_escalation=True,
                 interrupt_stage=InterruptStage.safety_gate,
                 verification_report=_section_sentinel(
@@ -604,13 +657,7 @@ async def uti_complete_patient_assessment(
                     InterruptStage.safety_gate,
                 ),
             )
-        if sa in [
-            ApprovalDecision.modify,
-            ApprovalDecision.conditional,
-            ApprovalDecision.reject,
-            ApprovalDecision.do_not_start,
-            ApprovalDecision.refer_no_antibiotics,
-        ]:
+        if safety_approval in _APPROVAL_REFINE:
             refine_prompt = make_reasoning_refinement_prompt(
                 context.patient_state, clinical_result, safety_result,
             )
@@ -623,78 +670,112 @@ async def uti_complete_patient_assessment(
                 output_type=agent.output_type,
                 tools=agent.tools,
             )
+    elif strict:
+        doctor_summary = await _maybe_doctor_summary(
+            patient_data, model, assessment_details, patient=patient,
+        )
+        return _build_output(
+            path=OrchestrationPath.deterministic_no_rx,
+            assessment=assessment_result,
+            clinical_reasoning=doctor_summary
+            or {"reasoning": ["No antibiotics per algorithm"], "confidence": 1.0},
+            safety_validation=_section_sentinel(
+                SectionStatus.not_applicable,
+                "Safety validation only runs for treatment pathways",
+                InterruptStage.deterministic_gate,
+            ),
+            presc=_section_sentinel(
+                SectionStatus.not_applicable,
+                "Prescribing considerations are only generated for treatment pathways",
+                InterruptStage.deterministic_gate,
+            ),
+            research=_section_sentinel(
+                SectionStatus.skipped,
+                "Skipped for deterministic no-Rx path",
+                InterruptStage.deterministic_gate,
+            ),
+            diagnosis=_section_sentinel(
+                SectionStatus.skipped,
+                "Skipped for deterministic no-Rx path",
+                InterruptStage.deterministic_gate,
+            ),
+            follow_up_details=_section_sentinel(
+                SectionStatus.not_applicable,
+                "Follow-up plan only generated for treatment pathways",
+                InterruptStage.deterministic_gate,
+            ),
+            consensus=ConsensusLabel.no_antibiotics_or_refer.value,
+            validator=_section_sentinel(
+                SectionStatus.skipped,
+                "Validator not run for deterministic no-Rx path",
+                InterruptStage.deterministic_gate,
+            ),
+            model=model,
+            patient_inputs=patient_data,
+            include_audit=include_audit,
+            human_escalation=False,
+            verification_report=_section_sentinel(
+                SectionStatus.skipped,
+                "Verification not run for deterministic no-Rx path",
+                InterruptStage.deterministic_gate,
+            ),
+            claims_with_citations=_section_sentinel(
+                SectionStatus.skipped,
+                "Claims extraction not run for deterministic no-Rx path",
+                InterruptStage.deterministic_gate,
+            ),
+        )
+    else:
+        clinical_result = {
+            "reasoning": ["Referral/no antibiotics per algorithm"],
+            "confidence": 1.0,
+        }
 
-    safety_approval = parse_approval(
-        (safety_result or {}).get("approval_recommendation", "undecided"),
-    )
     rec = assessment_result.get("recommendation") or {}
-    if isinstance(rec, dict) and rec:
-        rec_text = Recommendation(**rec).as_text()
-    else:
-        rec_text = "None"
+    # Render from the typed recommendation rather than re-validating its dump
+    rec_text = assessment.recommendation.as_text() if assessment.recommendation else "None"
 
     consensus_recommendation = ConsensusLabel.no_antibiotics_or_refer.value
     finalized_regimen_text = "None"
-    if decision == Decision.recommend_treatment and rec:
-        if safety_approval == ApprovalDecision.approve:
-            proposed = str(
-                clinical_result.get("proposed_regimen_text", "") or "",
-            ).strip()
-            finalized_regimen_text = proposed or rec_text
-            consensus_recommendation = finalized_regimen_text
-        elif safety_approval in [ApprovalDecision.modify, ApprovalDecision.conditional]:
-            alternatives = list(rec.get("alternatives", []) or [])
-            chosen_alt = None
-            if alternatives:
-                for alt in alternatives:
+    if treatment_path:
+        if safety_approval in _APPROVAL_INTERRUPT:
+            # refer_no_antibiotics keeps the regimen so the validator can flag it
+            if rec and safety_approval not in _APPROVAL_DEFER:
+                finalized_regimen_text = rec_text
+            consensus_recommendation = ConsensusLabel.defer_revise_plan_safety.value
+        elif rec:
+            if safety_approval == ApprovalDecision.approve:
+                proposed = str(
+                    clinical_result.get("proposed_regimen_text", "") or "",
+                ).strip()
+                finalized_regimen_text = proposed or rec_text
+                consensus_recommendation = finalized_regimen_text
+            elif safety_approval in _APPROVAL_MODIFY:
+                chosen_alt = None
+                for alt in rec.get("alternatives") or ():
                     if isinstance(alt, str) and alt.strip() and alt.strip() != rec_text:
                         chosen_alt = alt.strip()
                         break
-            if chosen_alt:
-                finalized_regimen_text = chosen_alt
-                consensus_recommendation = (
-                    f"Modify regimen: {chosen_alt} (per safety validation)"
-                )
+                if chosen_alt:
+                    finalized_regimen_text = chosen_alt
+                    consensus_recommendation = (
+                        f"Modify regimen: {chosen_alt} (per safety validation)"
+                    )
+                else:
+                    finalized_regimen_text = rec_text
+                    consensus_recommendation = (
+                        f"Modify regimen: {rec_text} (see safety validation)"
+                    )
             else:
                 finalized_regimen_text = rec_text
-                consensus_recommendation = (
-                    f"Modify regimen: {rec_text} (see safety validation)"
-                )
-        elif safety_approval in [
-            ApprovalDecision.reject,
-            ApprovalDecision.do_not_start,
-            ApprovalDecision.deny,
-        ]:
-            consensus_recommendation = ConsensusLabel.defer_choose_alternative.value
-        else:
-            finalized_regimen_text = rec_text
-            consensus_recommendation = rec_text
+                consensus_recommendation = rec_text
 
-    if decision == Decision.recommend_treatment:
-        if isinstance(safety_result, dict):
-            approval = parse_approval(
-                (safety_result or {}).get("approval_recommendation", "undecided"),
-            )
-            if approval in [
-                ApprovalDecision.reject,
-                ApprovalDecision.do_not_start,
-                ApprovalDecision.deny,
-                ApprovalDecision.refer_no_antibiotics,
-            ]:
-                consensus_recommendation = ConsensusLabel.defer_revise_plan_safety.value
-
-    validator = state_validator_op(patient_data, finalized_regimen_text, safety_result)
-    val_passed = (
-        bool(validator.get("passed", True))
-        if isinstance(validator, dict)
-        else bool(getattr(validator, "passed", True))
+    validator = state_validator_op(
+        patient_data, finalized_regimen_text, safety_result, patient=patient,
     )
-    val_severity = (
-        str(validator.get("severity", "")).lower()
-        if isinstance(validator, dict)
-        else str(getattr(validator, "severity", "")).lower()
-    )
-    if strict_interrupts_enabled() and val_severity == "high":
+    # Keep the typed result for branching; serialize it once for the outputs.
+    validator_dump = validator.model_dump()
+    if strict and validator.severity == "high":
         return _build_output(
             path=OrchestrationPath.validator_interrupt,
             assessment=assessment_result,
@@ -721,9 +802,10 @@ async def uti_complete_patient_assessment(
                 InterruptStage.validator,
             ),
             consensus=ConsensusLabel.validator_interrupt.value,
-            validator=safe_model_dump(validator),
+            validator=validator_dump,
             model=model,
             patient_inputs=patient_data,
+            include_audit=include_audit,
             human_escalation=True,
             interrupt_stage=InterruptStage.validator,
             verification_report=_section_sentinel(
@@ -737,15 +819,20 @@ async def uti_complete_patient_assessment(
                 InterruptStage.validator,
             ),
         )
+    # The verification decision depends only on reasoning, safety and the
+    # validator, so settle it before the research fan-out.
+    should_run_verification = should_verify(
+        clinical_result, validator_dump, safety_result, confidence_threshold=0.8,
+    )
+
     presc_result = None
     summary_result = None
     diagnosis_result = None
-    if val_passed:
+    if validator.passed:
         region = patient_data.get("locale_code", "CA-ON")
-        presc_task = prescribing_considerations(patient_data, region, model)
-        summary_task = web_research(
-            "Latest UTI guideline updates and resistance (concise)", region, model,
-        )
+        # One regional query serves both the research context and the
+        # prescribing considerations.
+        research_task = web_research(_REGIONAL_RESEARCH_QUERY, region, model)
         diagnosis_task = deep_research_diagnosis(
             patient_data,
             model,
@@ -753,16 +840,25 @@ async def uti_complete_patient_assessment(
             safety_validation_context=safety_result
             if isinstance(safety_result, dict)
             else None,
+            patient=patient,
         )
-        presc_result, summary_result, diagnosis_result = await asyncio.gather(
-            presc_task,
-            summary_task,
+        summary_result, diagnosis_result = await asyncio.gather(
+            research_task,
             diagnosis_task,
         )
+        presc_result = await prescribing_considerations(
+            patient_data,
+            region,
+            model,
+            patient=patient,
+            resistance_research=summary_result,
+        )
 
     follow_up_details = None
-    if decision == Decision.recommend_treatment:
-        follow_up_details = await follow_up_plan(patient_data)
+    if treatment_path:
+        follow_up_details = await follow_up_plan(
+            patient_data, patient=patient, assessment=assessment,
+        )
 
     final_snapshot = {
         "assessment": assessment_result,
@@ -771,42 +867,36 @@ async def uti_complete_patient_assessment(
         "diagnosis": diagnosis_result,
         "prescribing_considerations": presc_result,
         "research_context": summary_result,
-        "validator": validator,
+        "validator": validator_dump,
         "consensus_recommendation": consensus_recommendation,
     }
 
-    verification_report = None
-    should_run_verification = should_verify(
-        clinical_result, validator, safety_result, confidence_threshold=0.8,
-    )
-
+    # Claims are extracted from the diagnosis and research citations, so this
+    # call has to wait for the research gather above.
     verification_report = None
     claims_output = None
-    
     if should_run_verification:
-        verifier_prompt = make_verifier_prompt(final_snapshot)
-        claims_prompt = make_claim_extractor_prompt(final_snapshot)
-        verifier_agent = make_verifier_agent(model)
-        claims_agent = make_claim_extractor_agent(model)
-        verification_task = execute_agent(
-            agent_name=verifier_agent.name,
-            model=model,
-            instructions=verifier_agent.instructions,
-            prompt=verifier_prompt,
-            output_type=verifier_agent.output_type,
-            tools=getattr(verifier_agent, "tools", None),
-        )
-        claims_task = execute_agent(
-            agent_name=claims_agent.name,
+        # One call covers both outputs: the snapshot is serialized and sent once.
+        combined_prompt = make_verifier_claims_prompt(final_snapshot)
+        combined_agent = make_verifier_claims_agent(model)
+        combined = await execute_agent(
+            agent_name=combined_agent.name,
             model=model,
-            instructions=claims_agent.instructions,
-            prompt=claims_prompt,
-            output_type=claims_agent.output_type,
-            tools=getattr(claims_agent, "tools", None),
-        )
-        verification_report, claims_output = await asyncio.gather(
-            verification_task, claims_task,
+            instructions=combined_agent.instructions,
+            prompt=combined_prompt,
+            output_type=combined_agent.output_type,
+            tools=getattr(combined_agent, "tools", None),
         )
+        verification_report = {
+            "model": model,
+            "version": "v1",
+            **safe_model_dump(combined.get("verification_report")),
+        }
+        claims_output = {
+            "model": model,
+            "version": "v1",
+            **safe_model_dump(combined.get("claims_with_citations")),
+        }
     else:
         claims_prompt = make_claim_extractor_prompt(final_snapshot)
         claims_agent = make_claim_extractor_agent(model)
@@ -829,10 +919,24 @@ async def uti_complete_patient_assessment(
         diagnosis=diagnosis_result,
         follow_up_details=follow_up_details,
         consensus=consensus_recommendation,
-        validator=safe_model_dump(validator),
+        validator=validator_dump,
         model=model,
         patient_inputs=patient_data,
+        include_audit=include_audit,
         human_escalation=False,
         verification_report=verification_report,
         claims_with_citations=claims_output,
     )
+
+
+register_traced_ops(
+    state_validator_op,
+    clinical_reasoning,
+    safety_validation,
+    web_research,
+    prescribing_considerations,
+    deep_research_diagnosis,
+    assess_and_plan,
+    follow_up_plan,
+    uti_complete_patient_assessment,
+)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 
 from .models import (
     PREGNANCY_EXCLUSIONS,
@@ -15,23 +15,39 @@ from .models import (
     PatientState,
     Recommendation,
     RecurrenceResult,
+    RegimenFlags,
+    RuleContext,
+    ValidationRule,
     ValidatorResult,
 )
 
+# The treatment table is static, so validate each agent's recommendation once;
+# select_treatment hands out deep copies so callers can't alter the templates.
+_RECOMMENDATION_BY_AGENT: dict[MedicationAgent, Recommendation] = {
+    agent: Recommendation(
+        regimen=spec.regimen,
+        regimen_agent=spec.agent,
+        dose=spec.dose,
+        frequency=spec.frequency,
+        duration=spec.duration,
+        alternatives=spec.alternatives,
+        contraindications=spec.contraindications,
+        monitoring=spec.monitoring,
+    )
+    for agent, spec in TREATMENT_OPTIONS.items()
+}
+
 
 def assess_symptom_criteria(patient: PatientState) -> bool:
     """Check if patient meets UTI criteria: dysuria OR ≥2 of urgency/frequency/suprapubic_pain/hematuria"""
     symptoms = patient.symptoms
+    # Bools add as ints, so count the minor symptoms without building a list
     return (
         symptoms.dysuria
-        or sum(
-            [
-                symptoms.urgency,
-                symptoms.frequency,
-                symptoms.suprapubic_pain,
-                symptoms.hematuria,
-            ],
-        )
+        or symptoms.urgency
+        + symptoms.frequency
+        + symptoms.suprapubic_pain
+        + symptoms.hematuria
         >= 2
     )
 
@@ -39,53 +55,47 @@ def assess_symptom_criteria(patient: PatientState) -> bool:
 def has_nonspecific_symptoms(patient: PatientState) -> bool:
     """Check for nonspecific symptoms that require referral: confusion/delirium or gross hematuria"""
     symptoms = patient.symptoms
-    return any([symptoms.confusion, symptoms.delirium, symptoms.gross_hematuria])
+    return symptoms.confusion or symptoms.delirium or symptoms.gross_hematuria
 
 
 def check_complicating_factors(patient: PatientState) -> list[str]:
     """Check for complicating factors that require referral"""
-    complications = []
+    complications: list[str] = []
 
-    # Upper urinary tract or systemic disease (red flag symptoms)
+    # Upper urinary tract or systemic disease (red flag symptoms). Every factor
+    # is reported, so each check runs, but `or` chains stop at the first hit
+    # instead of materializing lists for any().
     red_flags = patient.red_flags
-    if any(
-        [
-            red_flags.fever,
-            red_flags.rigors,
-            red_flags.flank_pain,
-            red_flags.back_pain,
-            red_flags.nausea_vomiting,
-            red_flags.systemic,
-        ],
+    if (
+        red_flags.fever
+        or red_flags.rigors
+        or red_flags.flank_pain
+        or red_flags.back_pain
+        or red_flags.nausea_vomiting
+        or red_flags.systemic
     ):
         complications.append("systemic_or_upper_tract_symptoms")
 
     # Additional complicating factors
-    complication_checks = [
-        (patient.sex.value == "male", "male_patient"),
-        (
-            patient.sex.value == "female"
-            and patient.pregnancy_status not in PREGNANCY_EXCLUSIONS,
-            "pregnancy",
-        ),
-        (patient.age < 12, "pediatric_<12y"),
-        (patient.history.immunocompromised, "immunocompromised"),
-        (
-            any(
-                [
-                    patient.history.catheter,
-                    patient.history.neurogenic_bladder,
-                    patient.history.stones,
-                    patient.renal_function_summary.value != "normal",
-                ],
-            ),
-            "abnormal_urinary_tract_or_function",
-        ),
-    ]
+    sex = patient.sex.value
+    if sex == "male":
+        complications.append("male_patient")
+    if sex == "female" and patient.pregnancy_status not in PREGNANCY_EXCLUSIONS:
+        complications.append("pregnancy")
+    if patient.age < 12:
+        complications.append("pediatric_<12y")
+    history = patient.history
+    if history.immunocompromised:
+        complications.append("immunocompromised")
+    if (
+        history.catheter
+        or history.neurogenic_bladder
+        or history.stones
+        or patient.renal_function_summary.value != "normal"
+    ):
+        complications.append("abnormal_urinary_tract_or_function")
 
-    return complications + [
-        factor for condition, factor in complication_checks if condition
-    ]
+    return complications
 
 
 def check_recurrence_relapse(patient: PatientState) -> RecurrenceResult:
@@ -148,17 +158,7 @@ def select_treatment(patient: PatientState) -> Recommendation | None:
 
     for agent in preferred_order:
         if is_medication_allowed(agent):
-            spec = TREATMENT_OPTIONS[agent]
-            return Recommendation(
-                regimen=spec.regimen,
-                regimen_agent=spec.agent,
-                dose=spec.dose,
-                frequency=spec.frequency,
-                duration=spec.duration,
-                alternatives=spec.alternatives,
-                contraindications=spec.contraindications,
-                monitoring=spec.monitoring,
-            )
+            return _RECOMMENDATION_BY_AGENT[agent].model_copy(deep=True)
 
     return None
 
@@ -187,9 +187,43 @@ def get_follow_up_plan() -> dict:
     }
 
 
-def assess_uti_patient(patient: PatientState) -> AssessmentOutput:  # noqa: PLR0911
+def assess_uti_patient(patient: PatientState) -> AssessmentOutput:
+    """
+    Main UTI assessment entry point. The algorithm is a pure function of the
+    patient state, so results are memoized on the serialized state. Each call
+    gets a deep copy with fresh audit metadata, so callers can't alter the
+    cached entry.
+    """
+    cached = _assess_uti_patient_cached(patient.model_dump_json())
+    return cached.model_copy(deep=True, update={"audit": _create_audit()})
+
+
+@lru_cache(maxsize=1024)
+def _assess_uti_patient_cached(patient_json: str) -> AssessmentOutput:
+    return _run_assessment(PatientState.model_validate_json(patient_json))
+
+
+# Referral rationale phrasing, keyed by check_complicating_factors codes and
+# check_recurrence_relapse reasons
+_COMPLICATION_DESCRIPTIONS: dict[str, str] = {
+    "systemic_or_upper_tract_symptoms": "upper urinary tract or systemic disease with red flag symptoms including fever, rigors, flank pain, back pain, nausea, or vomiting",
+    "male_patient": "male sex, which increases complexity and risk of complications",
+    "pregnancy": "pregnancy, which requires specialized antibiotic selection and monitoring",
+    "pediatric_<12y": "age less than 12 years, requiring pediatric specialist management",
+    "immunocompromised": "immunocompromised status, increasing risk of treatment failure and complications",
+    "abnormal_urinary_tract_or_function": "abnormal urinary tract function or structure including indwelling catheter, neurogenic bladder, renal stones, or renal dysfunction",
+}
+
+_RECURRENCE_EXPLANATIONS: dict[str, str] = {
+    "relapse ≤4 weeks after treatment": "This patient experienced a relapse of UTI symptoms within 4 weeks of completing previous antibiotic treatment, suggesting possible treatment failure, antimicrobial resistance, or underlying predisposing factors.",
+    "recurrent UTI: ≥2 in 6 months": "This patient has experienced 2 or more UTI episodes within the past 6 months, meeting the definition for recurrent urinary tract infection.",
+    "recurrent UTI: ≥3 in 12 months": "This patient has experienced 3 or more UTI episodes within the past 12 months, meeting the definition for recurrent urinary tract infection.",
+}
+
+
+def _run_assessment(patient: PatientState) -> AssessmentOutput:  # noqa: PLR0911
     """
-    Main UTI assessment function following the Mermaid algorithm exactly:
+    UTI assessment following the Mermaid algorithm exactly:
     1. Check if patient has asymptomatic bacteriuria -> no antibiotics
     2. Check symptom criteria -> no antibiotics if not met (unless nonspecific symptoms -> refer)
     3. Check complicating factors -> refer if present
@@ -248,17 +282,8 @@ def assess_uti_patient(patient: PatientState) -> AssessmentOutput:  # noqa: PLR0
     # Step 3: Check for complicating factors
     complications = check_complicating_factors(patient)
     if complications:
-        complication_descriptions = {
-            "systemic_or_upper_tract_symptoms": "upper urinary tract or systemic disease with red flag symptoms including fever, rigors, flank pain, back pain, nausea, or vomiting",
-            "male_patient": "male sex, which increases complexity and risk of complications",
-            "pregnancy": "pregnancy, which requires specialized antibiotic selection and monitoring",
-            "pediatric_<12y": "age less than 12 years, requiring pediatric specialist management",
-            "immunocompromised": "immunocompromised status, increasing risk of treatment failure and complications",
-            "abnormal_urinary_tract_or_function": "abnormal urinary tract function or structure including indwelling catheter, neurogenic bladder, renal stones, or renal dysfunction",
-        }
-
         detailed_complications = [
-            complication_descriptions.get(comp, comp) for comp in complications
+            _COMPLICATION_DESCRIPTIONS.get(comp, comp) for comp in complications
         ]
         return AssessmentOutput(
             decision=Decision.refer_complicated,
@@ -279,16 +304,10 @@ def assess_uti_patient(patient: PatientState) -> AssessmentOutput:  # noqa: PLR0
     # Step 4: Check for recurrence or relapse
     recurrence_result = check_recurrence_relapse(patient)
     if recurrence_result.has_recurrence:
-        recurrence_explanation = {
-            "relapse ≤4 weeks after treatment": "This patient experienced a relapse of UTI symptoms within 4 weeks of completing previous antibiotic treatment, suggesting possible treatment failure, antimicrobial resistance, or underlying predisposing factors.",
-            "recurrent UTI: ≥2 in 6 months": "This patient has experienced 2 or more UTI episodes within the past 6 months, meeting the definition for recurrent urinary tract infection.",
-            "recurrent UTI: ≥3 in 12 months": "This patient has experienced 3 or more UTI episodes within the past 12 months, meeting the definition for recurrent urinary tract infection.",
-        }
-
         return AssessmentOutput(
             decision=Decision.refer_recurrence,
             rationale=[
-                recurrence_explanation.get(
+                _RECURRENCE_EXPLANATIONS.get(
                     recurrence_result.reason,
                     f"This patient presents with a recurrence pattern: {recurrence_result.reason}.",
                 ),
@@ -335,12 +354,15 @@ def assess_uti_patient(patient: PatientState) -> AssessmentOutput:  # noqa: PLR0
     )
 
 
-def get_enhanced_follow_up_plan(patient: PatientState) -> dict:
+def get_enhanced_follow_up_plan(
+    patient: PatientState,
+    assessment: AssessmentOutput | None = None,
+) -> dict:
     """Enhanced follow-up plan with patient-specific considerations"""
     base_plan = get_follow_up_plan()
 
-    # Get monitoring from patient's current assessment (efficient single call)
-    result = assess_uti_patient(patient)
+    # Reuse the caller's assessment for monitoring; only assess when absent
+    result = assessment if assessment is not None else assess_uti_patient(patient)
     monitoring = result.recommendation.monitoring if result.recommendation else []
 
     special_instructions = []
@@ -373,161 +395,139 @@ def get_contraindications_from_assessment(assessment: AssessmentOutput) -> list[
     return []
 
 
+_K_RAISING_MED_CLASSES = (History.MedClass.potassium_sparing, History.MedClass.nsaid)
+
+# Built once at import; each predicate runs lazily as applies(RuleContext).
+# Table order is the order rules are reported in. Within a rule, the regimen
+# flag goes first: it is a plain attribute read, and most rules target an agent
+# that is not in the regimen, so the patient checks are usually skipped.
+_VALIDATION_RULES: tuple[ValidationRule, ...] = (
+    # Safety contradictions
+    ValidationRule(
+        applies=lambda ctx: ctx.approval in REJECT_TERMS and ctx.regimen.present,
+        rule_name="Safety rejected but regimen present",
+        severity="high",
+        is_contradiction=True,
+    ),
+    # Allergy vs regimen contradictions (agent text match on common signals)
+    ValidationRule(
+        applies=lambda ctx: (
+            ctx.regimen.nitrofurantoin
+            and any("nitrofurantoin" in a for a in ctx.allergies)
+        ),
+        rule_name="allergy_conflict_nitrofurantoin",
+        severity="high",
+        is_contradiction=True,
+    ),
+    ValidationRule(
+        applies=lambda ctx: (
+            (ctx.regimen.tmp_smx or ctx.regimen.trimethoprim)
+            and any(any(k in a for k in TMP_SMX_ALLERGY_TERMS) for a in ctx.allergies)
+        ),
+        rule_name="allergy_conflict_tmpsmx_or_trimethoprim",
+        severity="high",
+        is_contradiction=True,
+    ),
+    ValidationRule(
+        applies=lambda ctx: (
+            ctx.regimen.fosfomycin and any("fosfomycin" in a for a in ctx.allergies)
+        ),
+        rule_name="allergy_conflict_fosfomycin",
+        severity="high",
+        is_contradiction=True,
+    ),
+    # Renal function rules
+    ValidationRule(
+        applies=lambda ctx: (
+            ctx.regimen.nitrofurantoin
+            and ctx.patient.renal_function_summary.value == "failure"
+        ),
+        rule_name="avoid_nitrofurantoin_in_renal_failure",
+        severity="high",
+    ),
+    ValidationRule(
+        applies=lambda ctx: (
+            ctx.regimen.nitrofurantoin
+            and ctx.patient.egfr_ml_min is not None
+            and ctx.patient.egfr_ml_min < 30
+        ),
+        rule_name="avoid_nitrofurantoin_egfr_lt_30",
+        severity="high",
+    ),
+    # Drug interaction rules
+    ValidationRule(
+        applies=lambda ctx: ctx.regimen.tmp_smx and ctx.patient.history.acei_arb_use,
+        rule_name="acei_arb_plus_tmpsmx_hyperkalemia_risk",
+    ),
+    ValidationRule(
+        applies=lambda ctx: (
+            ctx.regimen.tmp_smx
+            and any(
+                cls in ctx.patient.history.med_classes for cls in _K_RAISING_MED_CLASSES
+            )
+        ),
+        rule_name="tmpsmx_with_potassium_sparing_or_nsaid_monitor_k",
+    ),
+    # Age restrictions
+    ValidationRule(
+        applies=lambda ctx: ctx.regimen.fosfomycin and ctx.patient.age < 18,
+        rule_name="fosfomycin_not_indicated_under_18",
+        severity="high",
+    ),
+    # Duration checks
+    ValidationRule(
+        applies=lambda ctx: ctx.regimen.nitrofurantoin and not ctx.regimen.five_days,
+        rule_name="nitrofurantoin_duration_check_5_days",
+    ),
+    ValidationRule(
+        applies=lambda ctx: ctx.regimen.tmp_smx and not ctx.regimen.three_days,
+        rule_name="tmpsmx_duration_check_3_days",
+    ),
+    ValidationRule(
+        applies=lambda ctx: ctx.regimen.trimethoprim and not ctx.regimen.three_days,
+        rule_name="trimethoprim_duration_check_3_days",
+    ),
+    # Dose checks
+    ValidationRule(
+        applies=lambda ctx: ctx.regimen.fosfomycin and not ctx.regimen.fosfomycin_3g,
+        rule_name="fosfomycin_dose_check_3g_single_dose",
+    ),
+)
+
+
 def state_validator(
     patient: PatientState,
     regimen_text: str,
     safety: dict | None,
 ) -> ValidatorResult:
     """Validate patient state against UTI algorithm rules"""
-
-    @dataclass
-    class ValidationRule:
-        condition: bool
-        rule_name: str
-        severity: str = "moderate"
-        is_contradiction: bool = False
-
     rules_fired: list[str] = []
     contradictions: list[str] = []
     severity = "low"
 
-    try:
-        safety_approval = (
-            (safety or {}).get("approval_recommendation", "").lower()
-            if isinstance(safety, dict)
-            else ""
-        )
-        rt = regimen_text.lower()
-
-        validation_rules = [
-            # Safety contradictions
-            ValidationRule(
-                condition=safety_approval in REJECT_TERMS
-                and regimen_text
-                and rt != "none",
-                rule_name="Safety rejected but regimen present",
-                severity="high",
-                is_contradiction=True,
-            ),
-            # Allergy vs regimen contradictions (agent text match on common signals)
-            ValidationRule(
-                condition=(
-                    "nitrofurantoin" in rt
-                    and any(
-                        "nitrofurantoin" in a.lower()
-                        for a in (patient.history.allergies or [])
-                    )
-                ),
-                rule_name="allergy_conflict_nitrofurantoin",
-                severity="high",
-                is_contradiction=True,
-            ),
-            ValidationRule(
-                condition=(
-                    any(
-                        term in rt
-                        for term in ["tmp", "sulfamethoxazole", "smx", "trimethoprim"]
-                    )
-                    and any(
-                        any(k in a.lower() for k in TMP_SMX_ALLERGY_TERMS)
-                        for a in (patient.history.allergies or [])
-                    )
-                ),
-                rule_name="allergy_conflict_tmpsmx_or_trimethoprim",
-                severity="high",
-                is_contradiction=True,
-            ),
-            ValidationRule(
-                condition=(
-                    "fosfomycin" in rt
-                    and any(
-                        "fosfomycin" in a.lower()
-                        for a in (patient.history.allergies or [])
-                    )
-                ),
-                rule_name="allergy_conflict_fosfomycin",
-                severity="high",
-                is_contradiction=True,
-            ),
-            # Renal function rules
-            ValidationRule(
-                condition=patient.renal_function_summary.value == "failure"
-                and "nitrofurantoin" in rt,
-                rule_name="avoid_nitrofurantoin_in_renal_failure",
-                severity="high",
-            ),
-            ValidationRule(
-                condition=(
-                    patient.egfr_ml_min is not None
-                    and patient.egfr_ml_min < 30
-                    and "nitrofurantoin" in rt
-                ),
-                rule_name="avoid_nitrofurantoin_egfr_lt_30",
-                severity="high",
-            ),
-            # Drug interaction rules
-            ValidationRule(
-                condition=patient.history.acei_arb_use
-                and any(term in rt for term in ["tmp", "sulfamethoxazole", "smx"]),
-                rule_name="acei_arb_plus_tmpsmx_hyperkalemia_risk",
-            ),
-            ValidationRule(
-                condition=(
-                    any(term in rt for term in ["tmp", "sulfamethoxazole", "smx"])
-                    and any(
-                        cls in patient.history.med_classes
-                        for cls in [
-                            History.MedClass.potassium_sparing,
-                            History.MedClass.nsaid,
-                        ]
-                    )
-                ),
-                rule_name="tmpsmx_with_potassium_sparing_or_nsaid_monitor_k",
-            ),
-            # Age restrictions
-            ValidationRule(
-                condition=patient.age < 18 and "fosfomycin" in rt,
-                rule_name="fosfomycin_not_indicated_under_18",
-                severity="high",
-            ),
-            # Duration checks
-            ValidationRule(
-                condition="nitrofurantoin" in rt and "x 5" not in rt,
-                rule_name="nitrofurantoin_duration_check_5_days",
-            ),
-            ValidationRule(
-                condition=any(term in rt for term in ["tmp", "sulfamethoxazole", "smx"])
-                and "x 3" not in rt,
-                rule_name="tmpsmx_duration_check_3_days",
-            ),
-            ValidationRule(
-                condition="trimethoprim" in rt and "x 3" not in rt,
-                rule_name="trimethoprim_duration_check_3_days",
-            ),
-            # Dose checks
-            ValidationRule(
-                condition="fosfomycin" in rt
-                and not any(dose in rt for dose in ["3 g", "3g"]),
-                rule_name="fosfomycin_dose_check_3g_single_dose",
-            ),
-        ]
+    # Normalize the loosely typed inputs up front so the rules never raise
+    approval_raw = (
+        safety.get("approval_recommendation") if isinstance(safety, dict) else None
+    )
+    context = RuleContext(
+        patient=patient,
+        regimen=RegimenFlags.from_text(regimen_text or ""),
+        approval=str(getattr(approval_raw, "value", approval_raw) or "").lower(),
+        allergies=tuple(a.lower() for a in patient.history.allergies or []),
+    )
 
-        # Process rules
-        for rule in validation_rules:
-            if rule.condition:
-                if rule.is_contradiction:
-                    contradictions.append(rule.rule_name)
-                else:
-                    rules_fired.append(rule.rule_name)
-
-                # Update severity (high takes precedence)
-                if rule.severity == "high":
-                    severity = "high"
-                elif rule.severity == "moderate" and severity != "high":
-                    severity = "moderate"
-
-    except Exception:  # noqa: S110
-        pass  # Maintain existing error handling behavior
+    for rule in _VALIDATION_RULES:
+        if rule.applies(context):
+            if rule.is_contradiction:
+                contradictions.append(rule.rule_name)
+            else:
+                rules_fired.append(rule.rule_name)
+
+            # Update severity (high takes precedence)
+            if rule.severity == "high":
+                severity = "high"
+            elif rule.severity == "moderate" and severity != "high":
+                severity = "moderate"
 
     passed = severity != "high" and not contradictions
     return ValidatorResult(
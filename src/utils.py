@@ -1,20 +1,27 @@
 import os
+from functools import lru_cache
 
 from .models import ApprovalDecision, Decision
 
+_ELEVATED_LEVELS = frozenset({"moderate", "high"})
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+_DECISION_VALUES = frozenset(d.value for d in Decision)
+_APPROVAL_VALUES = frozenset(a.value for a in ApprovalDecision)
+
 
 def safe_model_dump(obj: object) -> dict[str, object]:
     if isinstance(obj, dict):
         return obj
-    if hasattr(obj, "model_dump"):
-        return obj.model_dump()
+    model_dump = getattr(obj, "model_dump", None)
+    if model_dump is not None:
+        return model_dump()
     return dict(obj) if obj is not None else {}
 
 
 def parse_decision(decision_raw: object) -> Decision:
     if isinstance(decision_raw, Decision):
         return decision_raw
-    if isinstance(decision_raw, str) and hasattr(Decision, decision_raw):
+    if isinstance(decision_raw, str) and decision_raw in _DECISION_VALUES:
         return Decision(decision_raw)
     return Decision.no_antibiotics_not_met
 
@@ -23,24 +30,105 @@ def parse_approval(approval_raw: object) -> ApprovalDecision:
     if isinstance(approval_raw, ApprovalDecision):
         return approval_raw
     approval_str = str(approval_raw).lower()
-    if approval_str in [e.value for e in ApprovalDecision]:
+    if approval_str in _APPROVAL_VALUES:
         return ApprovalDecision(approval_str)
     return ApprovalDecision.undecided
 
 
+@lru_cache(maxsize=1)
 def strict_interrupts_enabled() -> bool:
     raw = os.getenv("STRICT_INTERRUPTS", "true").strip().lower()
-    return raw in {"1", "true", "yes", "on"}
+    return raw in _TRUTHY
 
 
+@lru_cache(maxsize=1)
 def prescriber_signoff_required() -> bool:
     raw = os.getenv("PRESCRIBER_SIGNOFF_REQUIRED", "true").strip().lower()
-    return raw in {"1", "true", "yes", "on"}
+    return raw in _TRUTHY
 
 
+@lru_cache(maxsize=1)
 def doctor_summary_on_referral_enabled() -> bool:
     raw = os.getenv("DOCTOR_SUMMARY_ON_REFERRAL", "true").strip().lower()
-    return raw in {"1", "true", "yes", "on"}
+    return raw in _TRUTHY
+
+
+@lru_cache(maxsize=1)
+def doctor_summary_require_llm() -> bool:
+    raw = os.getenv("DOCTOR_SUMMARY_REQUIRE_LLM", "false").strip().lower()
+    return raw in _TRUTHY
+
+
+@lru_cache(maxsize=1)
+def parallel_safety_screen_enabled() -> bool:
+    raw = os.getenv("PARALLEL_SAFETY_SCREEN", "false").strip().lower()
+    return raw in _TRUTHY
+
+
+@lru_cache(maxsize=1)
+def audit_bundle_enabled() -> bool:
+    raw = os.getenv("INCLUDE_AUDIT_BUNDLE", "true").strip().lower()
+    return raw in _TRUTHY
+
+
+@lru_cache(maxsize=1)
+def llm_cache_enabled() -> bool:
+    raw = os.getenv("LLM_CACHE_ENABLED", "false").strip().lower()
+    return raw in _TRUTHY
+
+
+@lru_cache(maxsize=1)
+def llm_cache_ttl_s() -> int:
+    raw = os.getenv("LLM_CACHE_TTL_S", "3600").strip()
+    return max(1, int(raw)) if raw.isdigit() else 3600
+
+
+@lru_cache(maxsize=1)
+def llm_max_concurrency() -> int:
+    raw = os.getenv("LLM_MAX_CONCURRENCY", "16").strip()
+    return max(1, int(raw)) if raw.isdigit() else 16
+
+
+@lru_cache(maxsize=1)
+def weave_trace_sample_rate() -> float:
+    raw = os.getenv("WEAVE_TRACE_SAMPLE_RATE", "1.0").strip()
+    try:
+        return min(1.0, max(0.0, float(raw)))
+    except ValueError:
+        return 1.0
+
+
+# Weave ops whose tracing follows WEAVE_TRACE_SAMPLE_RATE; each module that
+# defines ops registers them at import time.
+_TRACED_OPS: list[object] = []
+
+
+def register_traced_ops(*ops: object) -> None:
+    _TRACED_OPS.extend(ops)
+
+
+def apply_trace_sampling() -> None:
+    # Weave samples root calls only; children inherit their root's decision,
+    # so a whole orchestration is either fully traced or not traced at all.
+    rate = weave_trace_sample_rate()
+    for op in _TRACED_OPS:
+        op.tracing_sample_rate = rate
+
+
+def refresh_flags() -> None:
+    for flag in (
+        strict_interrupts_enabled,
+        prescriber_signoff_required,
+        doctor_summary_on_referral_enabled,
+        doctor_summary_require_llm,
+        parallel_safety_screen_enabled,
+        audit_bundle_enabled,
+        llm_cache_enabled,
+        llm_cache_ttl_s,
+        llm_max_concurrency,
+        weave_trace_sample_rate,
+    ):
+        flag.cache_clear()
 
 
 def should_verify(
@@ -50,18 +138,14 @@ def should_verify(
     confidence_threshold: float = 0.8,
 ) -> bool:
     conf = float((clinical_reasoning or {}).get("confidence", 0.0) or 0.0)
+    if conf < confidence_threshold:
+        return True
     risk_raw = (
-        (safety_result or {}).get("risk_level")
-        if isinstance(safety_result, dict)
-        else None
+        safety_result.get("risk_level") if isinstance(safety_result, dict) else None
     )
-    risk_str = str(getattr(risk_raw, "value", risk_raw) or "").lower()
+    if risk_raw and str(getattr(risk_raw, "value", risk_raw)).lower() in _ELEVATED_LEVELS:
+        return True
+    # Only dump the validator once the cheaper signals have not decided it
     vdict = safe_model_dump(validator)
     severity = str(vdict.get("severity", "")).lower()
-    passed = bool(vdict.get("passed", True))
-    return (
-        (not passed)
-        or severity in ["moderate", "high"]
-        or conf < confidence_threshold
-        or risk_str in {"moderate", "high"}
-    )
+    return (not vdict.get("passed", True)) or severity in _ELEVATED_LEVELS
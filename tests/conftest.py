@@ -1,19 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.utils import refresh_flags
+
+# uvloop comes with uvicorn[standard]; fall back to the stdlib loop without it
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-@pytest.fixture(scope="session")
-def event_loop():
-    import asyncio
 
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    # pytest-asyncio builds each test loop from this policy; prefer uvloop
+    # where it is installed
+    if uvloop is None:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
 @pytest.fixture
@@ -26,7 +35,7 @@ def mock_openai_client():
 
 @pytest.fixture
 def mock_agent():
-    mock = AsyncMock()
+    mock = MagicMock()
     mock.model = "gpt-4.1"
     return mock
 
@@ -276,14 +285,13 @@ def elderly_patient_data() -> dict[str, Any]:
     }
 
 
-@pytest.fixture(autouse=True)
-def setup_test_environment():
+def pytest_configure(config):
+    # Process-wide test defaults, set once per session
     os.environ.setdefault("OPENAI_API_KEY", "test-key")
     os.environ.setdefault("OPENAI_AGENTS_DISABLE_TRACING", "1")
-    yield
 
-    # Clean up
-    test_keys = ["OPENAI_API_KEY", "OPENAI_AGENTS_DISABLE_TRACING"]
-    for key in test_keys:
-        if key in os.environ and os.environ[key] in ["test-key", "1"]:
-            del os.environ[key]
+
+@pytest.fixture(autouse=True)
+def refresh_runtime_flags():
+    # Runtime flags are cached per process; re-read them for every test
+    refresh_flags()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import factory
+import factory.random
 from faker import Faker
 
 from src.models import (
@@ -16,6 +17,12 @@ from src.models import (
     Symptoms,
 )
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+# factory.Faker declarations and this module's Faker share one generator;
+# seed it so randomized fields are reproducible from run to run
+factory.random.reseed_random(0xBEEF)
 fake = Faker()
 
 
@@ -287,3 +294,11 @@ def create_patient_dict(patient: PatientState) -> dict[str, Any]:
         "locale_code": patient.locale_code,
         "asymptomatic_bacteriuria": patient.asymptomatic_bacteriuria,
     }
+
+
+def create_agent_output(output: BaseModel, model: str = "gpt-4.1") -> dict[str, Any]:
+    """Mirror the dict execute_agent returns for a structured agent output"""
+    result: dict[str, Any] = {"model": model, "version": "v1", **output.model_dump()}
+    if hasattr(output, "as_narrative"):
+        result["narrative"] = output.as_narrative()
+    return result
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src import agents_research
+
+
+class TestExecuteAgentConcurrency:
+    """Test the process-wide cap on in-flight agent calls"""
+
+    @pytest.mark.asyncio
+    async def test_execute_agent_respects_semaphore(self):
+        """Test concurrent calls never exceed the semaphore limit"""
+        in_flight = 0
+        peak = 0
+
+        async def fake_run(*args: object, **kwargs: object) -> MagicMock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(final_output={})
+
+        with (
+            patch.object(
+                agents_research,
+                "_llm_semaphore",
+                return_value=asyncio.Semaphore(2),
+            ),
+            patch.object(agents_research.Runner, "run", side_effect=fake_run),
+        ):
+            results = await asyncio.gather(
+                *(
+                    agents_research.execute_agent("Agent", "gpt-4.1", "instr", "prompt")
+                    for _ in range(5)
+                ),
+            )
+
+        assert len(results) == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_backoff_releases_the_slot(self):
+        """Test a retrying call frees its slot while it backs off"""
+        order: list[str] = []
+        failed = False
+
+        async def fake_run(agent: object, prompt: str) -> MagicMock:
+            nonlocal failed
+            order.append(prompt)
+            if prompt == "flaky" and not failed:
+                failed = True
+                msg = "transient"
+                raise RuntimeError(msg)
+            return MagicMock(final_output={})
+
+        with (
+            patch.object(
+                agents_research,
+                "_llm_semaphore",
+                return_value=asyncio.Semaphore(1),
+            ),
+            patch.object(agents_research.Runner, "run", side_effect=fake_run),
+        ):
+            await asyncio.gather(
+                agents_research.execute_agent("Agent", "gpt-4.1", "instr", "flaky"),
+                agents_research.execute_agent("Agent", "gpt-4.1", "instr", "steady"),
+            )
+
+        assert order == ["flaky", "steady", "flaky"]
+
+    def test_semaphore_is_per_event_loop(self):
+        """Test each event loop gets its own semaphore"""
+
+        async def current() -> asyncio.Semaphore:
+            assert agents_research._llm_semaphore() is agents_research._llm_semaphore()
+            return agents_research._llm_semaphore()
+
+        semaphores = []
+        for _ in range(2):
+            # A private loop, so the suite's shared loop stays current
+            loop = asyncio.new_event_loop()
+            try:
+                semaphores.append(loop.run_until_complete(current()))
+            finally:
+                loop.close()
+
+        assert semaphores[0] is not semaphores[1]
+
+
+class TestAgentFactories:
+    """Test agent factory memoization"""
+
+    def test_agent_factories_cached_per_model(self):
+        """Test factories reuse one agent per model name"""
+        first = agents_research.make_clinical_reasoning_agent("gpt-4.1")
+
+        assert agents_research.make_clinical_reasoning_agent("gpt-4.1") is first
+        assert agents_research.make_clinical_reasoning_agent("gpt-4o") is not first
+        assert (
+            agents_research.make_safety_validation_agent("gpt-4.1").model == "gpt-4.1"
+        )
+
+    def test_structured_agents_use_strict_schemas(self):
+        """Test structured-output agents request strict schema-constrained decoding"""
+        for factory in (
+            agents_research.make_clinical_reasoning_agent,
+            agents_research.make_safety_validation_agent,
+            agents_research.make_claim_extractor_agent,
+            agents_research.make_verifier_claims_agent,
+        ):
+            assert factory("gpt-4.1").output_type.is_strict_json_schema()
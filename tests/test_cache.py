@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src import cache
+from src.services import uti_complete_patient_assessment
+from src.utils import refresh_flags
+from tests.factories import SimpleUTIPatientFactory, create_patient_dict
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        self.store[key] = value
+
+
+class TestLlmCache:
+    """Test the Redis-backed LLM response cache decorator"""
+
+    @pytest.mark.asyncio
+    async def test_llm_cache_disabled_calls_through(self):
+        """Test the wrapped call runs every time when caching is off"""
+        inner = AsyncMock(return_value={"narrative": "live"})
+        cached_fn = cache.llm_cache()(inner)
+
+        with patch.object(cache, "_redis_client") as mock_client:
+            await cached_fn({"age": 30}, model="gpt-4.1")
+            await cached_fn({"age": 30}, model="gpt-4.1")
+
+            mock_client.assert_not_called()
+        assert inner.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_llm_cache_hit_skips_call_and_ignores_patient(self):
+        """Test repeat inputs are served from cache regardless of the parsed patient"""
+        calls = 0
+
+        async def service(
+            patient_data: dict,
+            model: str = "gpt-4.1",
+            patient=None,
+        ) -> dict:
+            nonlocal calls
+            calls += 1
+            return {"narrative": f"call {calls}", "model": model}
+
+        cached_fn = cache.llm_cache()(service)
+        fake = FakeRedis()
+
+        with patch.dict(os.environ, {"LLM_CACHE_ENABLED": "true"}):
+            refresh_flags()
+            with patch.object(cache, "_redis_client", return_value=fake):
+                first = await cached_fn({"age": 30}, patient=object())
+                second = await cached_fn({"age": 30}, patient=object())
+                other = await cached_fn({"age": 31})
+        refresh_flags()
+
+        assert first == second == {"narrative": "call 1", "model": "gpt-4.1"}
+        assert other["narrative"] == "call 2"
+        assert len(fake.store) == 2
+
+    @pytest.mark.asyncio
+    async def test_llm_cache_redis_errors_fall_through(self):
+        """Test Redis failures never fail the wrapped call"""
+        inner = AsyncMock(return_value={"narrative": "live"})
+        cached_fn = cache.llm_cache()(inner)
+        broken = AsyncMock()
+        broken.get.side_effect = ConnectionError("down")
+        broken.setex.side_effect = ConnectionError("down")
+
+        with patch.dict(os.environ, {"LLM_CACHE_ENABLED": "true"}):
+            refresh_flags()
+            with patch.object(cache, "_redis_client", return_value=broken):
+                result = await cached_fn({"age": 30})
+        refresh_flags()
+
+        assert result == {"narrative": "live"}
+
+    @pytest.mark.asyncio
+    async def test_repeat_assessment_hits_cache_for_llm_stages(self):
+        """Test a repeated orchestration serves every cached stage from Redis"""
+        patient_data = create_patient_dict(SimpleUTIPatientFactory())
+        mock_execute = AsyncMock(
+            return_value={
+                "reasoning": ["Clear UTI symptoms"],
+                "confidence": 0.9,
+                "approval_recommendation": "approve",
+                "risk_level": "low",
+            },
+        )
+        mock_stream = AsyncMock(return_value={"text": "Evidence", "citations": []})
+        fake = FakeRedis()
+
+        with patch.dict(os.environ, {"LLM_CACHE_ENABLED": "true"}):
+            refresh_flags()
+            with (
+                patch.object(cache, "_redis_client", return_value=fake),
+                patch.multiple(
+                    "src.services",
+                    execute_agent=mock_execute,
+                    stream_text_and_citations=mock_stream,
+                ),
+            ):
+                await uti_complete_patient_assessment(patient_data)
+                first_calls = mock_execute.await_count
+                await uti_complete_patient_assessment(patient_data)
+        refresh_flags()
+
+        # Only the uncached claims extraction runs again on the repeat
+        assert mock_execute.await_count == first_calls + 1
+        assert mock_stream.await_count == 2
+        assert {key.split(":")[1] for key in fake.store} == {
+            "clinical_reasoning",
+            "safety_validation",
+            "web_research",
+            "deep_research_diagnosis",
+        }
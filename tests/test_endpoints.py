@@ -13,39 +13,49 @@ from tests.factories import (
     create_patient_dict,
 )
 
+# MCP tool parameters for an uncomplicated patient; tests override what they vary
+_BASE_PATIENT_KWARGS: dict[str, object] = {
+    "age": 25,
+    "sex": "female",
+    "pregnancy_status": "not_pregnant",
+    "renal_function_summary": "normal",
+    "egfr_ml_min": None,
+    "symptoms_dysuria": True,
+    "symptoms_urgency": False,
+    "symptoms_frequency": False,
+    "symptoms_suprapubic_pain": False,
+    "symptoms_hematuria": False,
+    "red_flags_fever": False,
+    "red_flags_rigors": False,
+    "red_flags_flank_pain": False,
+    "red_flags_nausea_vomiting": False,
+    "red_flags_systemic": False,
+    "history_antibiotics_last_90d": False,
+    "history_allergies": None,
+    "history_meds": None,
+    "history_acei_arb_use": False,
+    "history_catheter": False,
+    "history_neurogenic_bladder": None,
+    "history_stones": False,
+    "history_immunocompromised": False,
+    "recurrence_relapse_within_4w": False,
+    "recurrence_recurrent_6m": False,
+    "recurrence_recurrent_12m": False,
+    "locale_code": "CA-ON",
+}
+
 
 class TestBuildPatient:
     """Test the patient building helper function"""
 
     def test_build_patient_complete(self):
         result = _build_patient(
-            age=25,
-            sex="female",
-            pregnancy_status="not_pregnant",
-            renal_function_summary="normal",
-            egfr_ml_min=None,
-            symptoms_dysuria=True,
-            symptoms_urgency=True,
-            symptoms_frequency=False,
-            symptoms_suprapubic_pain=False,
-            symptoms_hematuria=False,
-            red_flags_fever=False,
-            red_flags_rigors=False,
-            red_flags_flank_pain=False,
-            red_flags_nausea_vomiting=False,
-            red_flags_systemic=False,
-            history_antibiotics_last_90d=False,
-            history_allergies=["penicillin"],
-            history_meds=["ibuprofen"],
-            history_acei_arb_use=False,
-            history_catheter=False,
-            history_neurogenic_bladder=None,
-            history_stones=False,
-            history_immunocompromised=False,
-            recurrence_relapse_within_4w=False,
-            recurrence_recurrent_6m=False,
-            recurrence_recurrent_12m=False,
-            locale_code="CA-ON",
+            **_BASE_PATIENT_KWARGS
+            | {
+                "symptoms_urgency": True,
+                "history_allergies": ["penicillin"],
+                "history_meds": ["ibuprofen"],
+            },
         )
 
         assert result["age"] == 25
@@ -58,33 +68,7 @@ class TestBuildPatient:
 
     def test_build_patient_none_lists(self):
         result = _build_patient(
-            age=25,
-            sex="female",
-            pregnancy_status="not_pregnant",
-            renal_function_summary="normal",
-            egfr_ml_min=None,
-            symptoms_dysuria=True,
-            symptoms_urgency=False,
-            symptoms_frequency=False,
-            symptoms_suprapubic_pain=False,
-            symptoms_hematuria=False,
-            red_flags_fever=False,
-            red_flags_rigors=False,
-            red_flags_flank_pain=False,
-            red_flags_nausea_vomiting=False,
-            red_flags_systemic=False,
-            history_antibiotics_last_90d=False,
-            history_allergies=None,
-            history_meds=None,
-            history_acei_arb_use=False,
-            history_catheter=False,
-            history_neurogenic_bladder=None,
-            history_stones=False,
-            history_immunocompromised=False,
-            recurrence_relapse_within_4w=False,
-            recurrence_recurrent_6m=False,
-            recurrence_recurrent_12m=False,
-            locale_code="CA-ON",
+            **_BASE_PATIENT_KWARGS | {"history_allergies": None, "history_meds": None},
         )
 
         assert result["history"]["allergies"] == []
@@ -211,33 +195,15 @@ class TestMCPToolHelpers:
         """Test that patient data can be built from MCP parameters"""
         # This tests the pattern used by MCP tools
         patient_data = _build_patient(
-            age=30,
-            sex="female",
-            pregnancy_status="not_pregnant",
-            renal_function_summary="normal",
-            egfr_ml_min=None,
-            symptoms_dysuria=True,
-            symptoms_urgency=False,
-            symptoms_frequency=True,
-            symptoms_suprapubic_pain=True,
-            symptoms_hematuria=False,
-            red_flags_fever=False,
-            red_flags_rigors=False,
-            red_flags_flank_pain=False,
-            red_flags_nausea_vomiting=False,
-            red_flags_systemic=False,
-            history_antibiotics_last_90d=False,
-            history_allergies=["sulfa"],
-            history_meds=["lisinopril"],
-            history_acei_arb_use=True,
-            history_catheter=False,
-            history_neurogenic_bladder=None,
-            history_stones=False,
-            history_immunocompromised=False,
-            recurrence_relapse_within_4w=False,
-            recurrence_recurrent_6m=False,
-            recurrence_recurrent_12m=False,
-            locale_code="CA-ON",
+            **_BASE_PATIENT_KWARGS
+            | {
+                "age": 30,
+                "symptoms_frequency": True,
+                "symptoms_suprapubic_pain": True,
+                "history_allergies": ["sulfa"],
+                "history_meds": ["lisinopril"],
+                "history_acei_arb_use": True,
+            },
         )
 
         # Verify structure matches what services expect
@@ -270,35 +236,7 @@ class TestMCPToolHelpers:
 
     def test_json_serialization_compatibility(self):
         """Test that helper outputs are JSON serializable"""
-        patient_data = _build_patient(
-            age=25,
-            sex="female",
-            pregnancy_status="not_pregnant",
-            renal_function_summary="normal",
-            egfr_ml_min=None,
-            symptoms_dysuria=True,
-            symptoms_urgency=False,
-            symptoms_frequency=False,
-            symptoms_suprapubic_pain=False,
-            symptoms_hematuria=False,
-            red_flags_fever=False,
-            red_flags_rigors=False,
-            red_flags_flank_pain=False,
-            red_flags_nausea_vomiting=False,
-            red_flags_systemic=False,
-            history_antibiotics_last_90d=False,
-            history_allergies=None,
-            history_meds=None,
-            history_acei_arb_use=False,
-            history_catheter=False,
-            history_neurogenic_bladder=None,
-            history_stones=False,
-            history_immunocompromised=False,
-            recurrence_relapse_within_4w=False,
-            recurrence_recurrent_6m=False,
-            recurrence_recurrent_12m=False,
-            locale_code="CA-ON",
-        )
+        patient_data = _build_patient(**_BASE_PATIENT_KWARGS)
 
         # Should serialize without errors
         json_str = json.dumps(patient_data)
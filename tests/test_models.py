@@ -21,6 +21,7 @@ from src.models import (
     Recurrence,
     RecurrenceResult,
     RedFlags,
+    RegimenFlags,
     RenalFunction,
     RiskLevel,
     SafetyValidationOutput,
@@ -158,6 +159,23 @@ class TestRecurrenceResult:
         assert result.reason == ""
 
 
+class TestRegimenFlags:
+    def test_regimen_flags_from_text(self):
+        flags = RegimenFlags.from_text("TMP/SMX 160/800 mg PO BID x 3 days")
+        assert flags.present is True
+        assert flags.tmp_smx is True
+        assert flags.three_days is True
+        assert flags.nitrofurantoin is False
+
+        fosfomycin = RegimenFlags.from_text("Fosfomycin 3 g PO once")
+        assert fosfomycin.fosfomycin is True
+        assert fosfomycin.fosfomycin_3g is True
+
+    def test_regimen_flags_none_text(self):
+        assert RegimenFlags.from_text("None").present is False
+        assert RegimenFlags.from_text("").present is False
+
+
 class TestSymptoms:
     def test_symptoms_valid_creation(self):
         symptoms = Symptoms(
@@ -258,3 +258,23 @@ class TestPromptConsistency:
             assert 50 < len(prompt) < 10000
             # Should not be mostly whitespace
             assert len(prompt.strip()) > len(prompt) * 0.8
+
+    def test_static_prefix_shared_across_requests(self):
+        """Test per-request data follows the static blocks so prefixes stay cacheable"""
+        first = SimpleUTIPatientFactory(age=30)
+        second = SimpleUTIPatientFactory(age=70)
+
+        def prefix(prompt: str, marker: str) -> str:
+            return prompt[: prompt.index(marker)]
+
+        assert prefix(make_clinical_reasoning_prompt(first), "<PATIENT_DATA>") == prefix(
+            make_clinical_reasoning_prompt(second), "<PATIENT_DATA>",
+        )
+        assert "<TASK>" in prefix(make_clinical_reasoning_prompt(first), "<PATIENT_DATA>")
+        assert "<SAFETY_SCREENING_TASKS>" in prefix(
+            make_safety_validation_prompt(first, "recommend_treatment", "x"),
+            "<PATIENT_SAFETY_PROFILE>",
+        )
+        assert "<OUTPUT_FORMAT>" in prefix(
+            make_web_research_prompt("q", "CA-ON"), "<RESEARCH_PARAMETERS>",
+        )
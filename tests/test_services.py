@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 # ruff: noqa: SIM117
+import asyncio
+import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -9,6 +11,7 @@ from src.models import (
     ApprovalDecision,
     AssessmentOutput,
     ClinicalReasoningOutput,
+    ConsensusLabel,
     Decision,
     Recommendation,
     SafetyValidationOutput,
@@ -28,6 +31,7 @@ from tests.factories import (
     ComplicatedUTIPatientFactory,
     ElderlyUTIPatientFactory,
     SimpleUTIPatientFactory,
+    create_agent_output,
     create_patient_dict,
 )
 
@@ -54,7 +58,7 @@ class TestClinicalReasoning:
                 mock_agent = AsyncMock()
                 mock_agent.model = "gpt-4.1"
                 mock_make_agent.return_value = mock_agent
-                mock_run.return_value = mock_output
+                mock_run.return_value = create_agent_output(mock_output)
 
                 result = await clinical_reasoning(patient_data, model="gpt-4.1")
 
@@ -88,7 +92,7 @@ class TestClinicalReasoning:
                     mock_agent = AsyncMock()
                     mock_agent.model = "gpt-4.1"
                     mock_make_agent.return_value = mock_agent
-                    mock_run.return_value = mock_output
+                    mock_run.return_value = create_agent_output(mock_output)
 
                     result = await clinical_reasoning(
                         patient_data,
@@ -131,7 +135,7 @@ class TestSafetyValidation:
                 mock_agent = AsyncMock()
                 mock_agent.model = "gpt-4.1"
                 mock_make_agent.return_value = mock_agent
-                mock_run.return_value = mock_output
+                mock_run.return_value = create_agent_output(mock_output)
 
                 result = await safety_validation(
                     patient_data,
@@ -158,7 +162,7 @@ class TestSafetyValidation:
                 mock_agent = AsyncMock()
                 mock_agent.model = "gpt-4.1"
                 mock_make_agent.return_value = mock_agent
-                mock_run.return_value = mock_output
+                mock_run.return_value = create_agent_output(mock_output)
 
                 result = await safety_validation(
                     patient_data,
@@ -188,7 +192,7 @@ class TestSafetyValidation:
                     mock_agent = AsyncMock()
                     mock_agent.model = "gpt-4.1"
                     mock_make_agent.return_value = mock_agent
-                    mock_run.return_value = mock_output
+                    mock_run.return_value = create_agent_output(mock_output)
 
                     result = await safety_validation(
                         patient_data,
@@ -304,6 +308,25 @@ class TestPrescribingConsiderations:
                     considerations_text = " ".join(result["considerations"])
                     assert "Age <18 for fosfomycin" in considerations_text
 
+    @pytest.mark.asyncio
+    async def test_prescribing_considerations_uses_prefetched_research(self):
+        patient_data = create_patient_dict(SimpleUTIPatientFactory())
+        prefetched = {
+            "summary": "Prefetched resistance summary",
+            "citations": [{"title": "Report", "url": "http://example.com"}],
+        }
+
+        with patch("src.services.web_research") as mock_web_research:
+            result = await prescribing_considerations(
+                patient_data, "CA-ON", resistance_research=prefetched,
+            )
+
+            mock_web_research.assert_not_called()
+            assert result["citations"] == prefetched["citations"]
+            assert any(
+                "Prefetched resistance summary" in c for c in result["considerations"]
+            )
+
     # removed: test for web research failure fallback (behavior simplified)
 
 
@@ -384,6 +407,11 @@ class TestAssessAndPlan:
             ]
             assert result["version"] == "v1"
             assert "narrative" in result
+            assert "recommendation_text" not in result
+            assert (
+                "Recommendation: Nitrofurantoin macrocrystals 100 mg PO BID x 5 days"
+                in result["narrative"]
+            )
 
     # removed: assess_and_plan invalid-data exception test
 
@@ -413,6 +441,11 @@ class TestFollowUpPlan:
 
             # Check narrative formatting
             assert "72-hour follow-up plan prepared" in result["narrative"]
+            assert "Monitoring:\n• Monitor for side effects" in result["narrative"]
+            assert (
+                "Special Instructions:\n• Monitor elderly patients closely"
+                in result["narrative"]
+            )
 
     # removed: follow_up_plan invalid-data exception test
 
@@ -445,6 +478,7 @@ class TestFinalConsolidatedAgent:
             "approval_recommendation": ApprovalDecision.approve,
             "risk_level": "low",
         }
+        mock_web_research = AsyncMock(return_value={"summary": "Research summary"})
 
         with patch.multiple(
             "src.services",
@@ -452,7 +486,7 @@ class TestFinalConsolidatedAgent:
             clinical_reasoning=AsyncMock(return_value=mock_clinical),
             safety_validation=AsyncMock(return_value=mock_safety),
             prescribing_considerations=AsyncMock(return_value={"considerations": []}),
-            web_research=AsyncMock(return_value={"summary": "Research summary"}),
+            web_research=mock_web_research,
             deep_research_diagnosis=AsyncMock(
                 return_value={"diagnosis": "UTI diagnosis"},
             ),
@@ -480,6 +514,183 @@ class TestFinalConsolidatedAgent:
                 assert result["model"] == "gpt-4.1"
                 assert result["version"] == "v1"
 
+                # A single regional research call feeds both consumers
+                mock_web_research.assert_awaited_once()
+                assert result["research_context"] == {"summary": "Research summary"}
+
+    @pytest.mark.asyncio
+    async def test_uti_complete_patient_assessment_referral_skips_follow_up(self):
+        """Test the deterministic referral interrupt never builds a follow-up plan"""
+        patient_data = create_patient_dict(ComplicatedUTIPatientFactory())
+        mock_follow_up = AsyncMock(return_value={"follow_up_plan": {}})
+
+        with patch.multiple(
+            "src.services",
+            _maybe_doctor_summary=AsyncMock(return_value=None),
+            follow_up_plan=mock_follow_up,
+        ):
+            result = await uti_complete_patient_assessment(patient_data)
+
+        assert result["orchestration_path"] == "deterministic_interrupt"
+        assert result["follow_up_details"]["status"] == "not_applicable"
+        mock_follow_up.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_uti_complete_patient_assessment_safety_reject_without_strict(self):
+        patient_data = create_patient_dict(SimpleUTIPatientFactory())
+
+        mock_assessment = {
+            "decision": Decision.recommend_treatment,
+            "recommendation": {
+                "regimen": "Nitrofurantoin macrocrystals",
+                "dose": "100 mg",
+                "frequency": "PO BID",
+                "duration": "5 days",
+            },
+        }
+        mock_safety = {
+            "approval_recommendation": ApprovalDecision.reject,
+            "risk_level": "high",
+        }
+
+        with patch.dict(os.environ, {"STRICT_INTERRUPTS": "false"}):
+            with patch.multiple(
+                "src.services",
+                assess_and_plan=AsyncMock(return_value=mock_assessment),
+                clinical_reasoning=AsyncMock(return_value={"confidence": 0.9}),
+                safety_validation=AsyncMock(return_value=mock_safety),
+                web_research=AsyncMock(return_value={"summary": ""}),
+                deep_research_diagnosis=AsyncMock(return_value={}),
+                follow_up_plan=AsyncMock(return_value={}),
+                execute_agent=AsyncMock(return_value={}),
+            ):
+                result = await uti_complete_patient_assessment(patient_data)
+
+        assert result["consensus_recommendation"] == (
+            ConsensusLabel.defer_revise_plan_safety.value
+        )
+
+    @pytest.mark.asyncio
+    async def test_uti_complete_patient_assessment_parallel_safety_screen(self):
+        patient_data = create_patient_dict(SimpleUTIPatientFactory())
+
+        mock_assessment = {
+            "decision": Decision.recommend_treatment,
+            "recommendation": {
+                "regimen": "Nitrofurantoin macrocrystals",
+                "dose": "100 mg",
+                "frequency": "PO BID",
+                "duration": "5 days",
+            },
+        }
+        mock_safety = AsyncMock(
+            return_value={
+                "approval_recommendation": ApprovalDecision.approve,
+                "risk_level": "low",
+            },
+        )
+
+        with patch.dict(os.environ, {"PARALLEL_SAFETY_SCREEN": "true"}):
+            with patch.multiple(
+                "src.services",
+                assess_and_plan=AsyncMock(return_value=mock_assessment),
+                clinical_reasoning=AsyncMock(return_value={"confidence": 0.9}),
+                safety_validation=mock_safety,
+                web_research=AsyncMock(return_value={"summary": ""}),
+                deep_research_diagnosis=AsyncMock(return_value={}),
+                follow_up_plan=AsyncMock(return_value={}),
+                execute_agent=AsyncMock(return_value={}),
+            ):
+                result = await uti_complete_patient_assessment(patient_data)
+
+        mock_safety.assert_awaited_once()
+        assert "clinical_reasoning_context" not in mock_safety.call_args.kwargs
+        assert result["orchestration_path"] == "standard"
+
+    @pytest.mark.asyncio
+    async def test_parallel_safety_screen_cancelled_when_reasoning_fails(self):
+        """Test a failed clinical reasoning call does not leave the screen running"""
+        patient_data = create_patient_dict(SimpleUTIPatientFactory())
+        cancelled = asyncio.Event()
+
+        async def slow_safety(*args: object, **kwargs: object) -> dict:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return {}
+
+        async def failing_reasoning(*args: object, **kwargs: object) -> dict:
+            await asyncio.sleep(0)  # let the screen start first
+            msg = "LLM down"
+            raise RuntimeError(msg)
+
+        with patch.dict(os.environ, {"PARALLEL_SAFETY_SCREEN": "true"}):
+            with patch.multiple(
+                "src.services",
+                clinical_reasoning=failing_reasoning,
+                safety_validation=slow_safety,
+            ):
+                with pytest.raises(RuntimeError, match="LLM down"):
+                    await uti_complete_patient_assessment(patient_data)
+                await asyncio.sleep(0)
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_uti_complete_patient_assessment_combined_verification(self):
+        patient = SimpleUTIPatientFactory()
+        patient_data = create_patient_dict(patient)
+
+        mock_assessment = {
+            "decision": Decision.recommend_treatment,
+            "recommendation": {
+                "regimen": "Nitrofurantoin macrocrystals",
+                "dose": "100 mg",
+                "frequency": "PO BID",
+                "duration": "5 days",
+            },
+        }
+
+        # Low confidence forces the verification pass
+        mock_clinical = {"reasoning": ["Possible UTI"], "confidence": 0.5}
+
+        mock_safety = {
+            "approval_recommendation": ApprovalDecision.approve,
+            "risk_level": "low",
+        }
+
+        mock_combined = {
+            "verification_report": {"verdict": "needs_review"},
+            "claims_with_citations": {"claims": [{"claim_text": "UTI likely"}]},
+        }
+
+        mock_execute = AsyncMock(return_value=mock_combined)
+        with patch.multiple(
+            "src.services",
+            assess_and_plan=AsyncMock(return_value=mock_assessment),
+            clinical_reasoning=AsyncMock(return_value=mock_clinical),
+            safety_validation=AsyncMock(return_value=mock_safety),
+            prescribing_considerations=AsyncMock(return_value={"considerations": []}),
+            web_research=AsyncMock(return_value={"summary": "Research summary"}),
+            deep_research_diagnosis=AsyncMock(
+                return_value={"diagnosis": "UTI diagnosis"},
+            ),
+            follow_up_plan=AsyncMock(return_value={"follow_up_plan": {}}),
+            execute_agent=mock_execute,
+        ):
+            result = await uti_complete_patient_assessment(
+                patient_data,
+                model="gpt-4.1",
+            )
+
+            mock_execute.assert_called_once()
+            assert result["verification_report"]["verdict"] == "needs_review"
+            assert result["claims_with_citations"]["claims"] == [
+                {"claim_text": "UTI likely"},
+            ]
+
     @pytest.mark.asyncio
     async def test_uti_complete_patient_assessment_referral_path(self):
         patient = ComplicatedUTIPatientFactory()
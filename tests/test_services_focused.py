@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 # ruff: noqa: SIM117
-from unittest.mock import MagicMock, patch
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -9,10 +10,13 @@ from src import services
 from src.models import (
     ApprovalDecision,
     ClinicalReasoningOutput,
+    OrchestrationPath,
     SafetyValidationOutput,
 )
+from src.utils import apply_trace_sampling, refresh_flags
 from tests.factories import (
     SimpleUTIPatientFactory,
+    create_agent_output,
     create_patient_dict,
 )
 
@@ -51,7 +55,7 @@ class TestServicesErrorHandling:
 
         with patch("src.services.execute_agent") as mock_run:
             with patch("src.services.make_safety_validation_agent") as mock_agent:
-                mock_run.return_value = mock_output
+                mock_run.return_value = create_agent_output(mock_output)
                 mock_agent.return_value = MagicMock(model="gpt-4.1")
 
                 # Test with invalid decision
@@ -75,7 +79,7 @@ class TestServicesErrorHandling:
 
         with patch("src.services.execute_agent") as mock_run:
             with patch("src.services.make_safety_validation_agent") as mock_agent:
-                mock_run.return_value = mock_output
+                mock_run.return_value = create_agent_output(mock_output)
                 mock_agent.return_value = MagicMock(model="gpt-4.1")
 
                 # Test with malformed recommendation dict
@@ -112,7 +116,7 @@ class TestServiceParameterHandling:
 
         with patch("src.services.execute_agent") as mock_run:
             with patch("src.services.make_clinical_reasoning_agent") as mock_agent:
-                mock_run.return_value = mock_output
+                mock_run.return_value = create_agent_output(mock_output)
                 mock_agent.return_value = MagicMock(model="gpt-4.1")
 
                 result = await services.clinical_reasoning(
@@ -306,3 +310,147 @@ class TestServiceModelIntegration:
         rec_text = rec.as_text()
         expected = "Nitrofurantoin 100 mg PO BID"
         assert rec_text == expected
+
+
+class TestBuildOutput:
+    """Test final output assembly in services module"""
+
+    def test_build_output_audit_bundle_reuses_sections(self):
+        """Test audit bundle references the same section dicts without copying"""
+        assessment = {"decision": "recommend_treatment"}
+        clinical = {"reasoning": ["UTI"], "confidence": 0.9}
+        patient_inputs = {"age": 25}
+
+        out = services._build_output(
+            path=OrchestrationPath.standard,
+            assessment=assessment,
+            clinical_reasoning=clinical,
+            safety_validation=None,
+            presc=None,
+            research=None,
+            diagnosis=None,
+            follow_up_details=None,
+            consensus="Nitrofurantoin",
+            validator={"passed": True},
+            model="gpt-4.1",
+            patient_inputs=patient_inputs,
+            human_escalation=False,
+        )
+
+        audit = out["audit_bundle"]
+        assert audit["assessment"] is assessment
+        assert audit["clinical_reasoning"] is clinical
+        assert audit["inputs"] is patient_inputs
+        assert audit["consensus_recommendation"] == "Nitrofurantoin"
+        assert audit["claims_with_citations"] == {}
+
+    def test_build_output_without_audit_bundle(self):
+        """Test trimmed output omits the audit bundle"""
+        out = services._build_output(
+            path=OrchestrationPath.standard,
+            assessment={"decision": "recommend_treatment"},
+            clinical_reasoning=None,
+            safety_validation=None,
+            presc=None,
+            research=None,
+            diagnosis=None,
+            follow_up_details=None,
+            consensus="Nitrofurantoin",
+            validator=None,
+            model="gpt-4.1",
+            patient_inputs={"age": 25},
+            human_escalation=False,
+            include_audit=False,
+        )
+
+        assert "audit_bundle" not in out
+        assert out["consensus_recommendation"] == "Nitrofurantoin"
+
+
+class TestDoctorSummary:
+    """Test doctor summary generation on deterministic interrupts"""
+
+    @pytest.mark.asyncio
+    async def test_doctor_summary_templated_without_llm(self):
+        """Test the summary is built from the assessment without an agent call"""
+        assessment_details = {
+            "decision": "refer_complicated",
+            "rationale": ["Fever present", "Refer to physician"],
+        }
+
+        with patch.dict(os.environ, {"DOCTOR_SUMMARY_REQUIRE_LLM": "false"}):
+            with patch(
+                "src.services.clinical_reasoning", new_callable=AsyncMock,
+            ) as mock_reasoning:
+                result = await services._maybe_doctor_summary(
+                    {}, "gpt-4.1", assessment_details,
+                )
+
+                mock_reasoning.assert_not_called()
+                assert result["confidence"] == 1.0
+                assert result["reasoning"] == ["Fever present", "Refer to physician"]
+                assert "refer_complicated" in result["narrative"]
+
+    @pytest.mark.asyncio
+    async def test_doctor_summary_llm_when_required(self):
+        """Test the summary falls back to clinical reasoning when forced"""
+        with patch.dict(os.environ, {"DOCTOR_SUMMARY_REQUIRE_LLM": "true"}):
+            with patch(
+                "src.services.clinical_reasoning", new_callable=AsyncMock,
+            ) as mock_reasoning:
+                mock_reasoning.return_value = {
+                    "narrative": "LLM summary",
+                    "confidence": 0.7,
+                    "reasoning": ["LLM reasoning"],
+                }
+
+                result = await services._maybe_doctor_summary(
+                    {}, "gpt-4.1", {"decision": "refer_recurrence"},
+                )
+
+                mock_reasoning.assert_called_once()
+                assert result["narrative"] == "LLM summary"
+
+
+class TestPatientContext:
+    """Test PatientState reuse across service calls"""
+
+    def test_from_patient_data_reuses_prebuilt_patient(self):
+        """Test a prebuilt PatientState is shared instead of re-validated"""
+        patient = SimpleUTIPatientFactory()
+        patient_data = create_patient_dict(patient)
+
+        context = services.PatientContext.from_patient_data(patient_data, patient)
+
+        assert context.patient_state is patient
+
+    @pytest.mark.asyncio
+    async def test_follow_up_plan_accepts_prebuilt_patient(self):
+        """Test services use the provided PatientState instead of parsing the dict"""
+        patient = SimpleUTIPatientFactory(age=75)
+        patient_data = create_patient_dict(patient)
+
+        with patch("src.services.PatientState") as mock_patient_state:
+            result = await services.follow_up_plan(patient_data, patient=patient)
+
+            mock_patient_state.assert_not_called()
+            assert any(
+                "elderly" in instruction.lower()
+                for instruction in result["special_instructions"]
+            )
+
+
+class TestTraceSampling:
+    """Test Weave trace sampling on the registered service ops"""
+
+    def test_apply_trace_sampling_sets_rate_on_ops(self):
+        """Test the configured sample rate is applied to every service op"""
+        with patch.dict(os.environ, {"WEAVE_TRACE_SAMPLE_RATE": "0.1"}):
+            refresh_flags()
+            apply_trace_sampling()
+            assert services.clinical_reasoning.tracing_sample_rate == 0.1
+            assert services.uti_complete_patient_assessment.tracing_sample_rate == 0.1
+
+        refresh_flags()
+        apply_trace_sampling()
+        assert services.clinical_reasoning.tracing_sample_rate == 1.0
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime
+from unittest.mock import patch
 
 from src.models import (
+    TREATMENT_OPTIONS,
+    ApprovalDecision,
     Decision,
     MedicationAgent,
     RenalFunction,
@@ -285,6 +288,15 @@ class TestSelectTreatment:
         assert rec.regimen_agent == MedicationAgent.nitrofurantoin
         assert rec.regimen == "Nitrofurantoin macrocrystals"
 
+    def test_recommendation_copies_do_not_share_lists(self):
+        first = select_treatment(SimpleUTIPatientFactory())
+        first.monitoring.append("Patient-specific note")
+        second = select_treatment(SimpleUTIPatientFactory())
+
+        expected = TREATMENT_OPTIONS[MedicationAgent.nitrofurantoin].monitoring
+        assert second.monitoring == expected
+        assert "Patient-specific note" not in second.monitoring
+
     def test_nitrofurantoin_contraindicated_low_egfr(self):
         patient = ElderlyUTIPatientFactory()
         patient.egfr_ml_min = 25.0  # < 30
@@ -460,6 +472,29 @@ class TestAssessUTIPatient:
         assert "timestamp" in result.audit
         assert "algorithm_version" in result.audit
 
+    def test_memoized_result_tracks_patient_state(self):
+        patient = SimpleUTIPatientFactory()
+
+        first = assess_uti_patient(patient)
+        second = assess_uti_patient(patient)
+        patient.history.antibiotics_last_90d = True
+        changed = assess_uti_patient(patient)
+
+        assert first is not second
+        assert first.model_dump(exclude={"audit"}) == second.model_dump(exclude={"audit"})
+        assert changed.decision == Decision.refer_complicated
+
+    def test_memoized_result_mutation_does_not_leak(self):
+        patient = SimpleUTIPatientFactory()
+
+        first = assess_uti_patient(patient)
+        first.rationale.append("edited by caller")
+        first.recommendation.monitoring.append("edited by caller")
+        second = assess_uti_patient(patient)
+
+        assert "edited by caller" not in second.rationale
+        assert "edited by caller" not in second.recommendation.monitoring
+
 
 class TestFollowUpPlan:
     def test_get_follow_up_plan(self):
@@ -488,6 +523,16 @@ class TestFollowUpPlan:
             "documentation" in action.lower() for action in plan["provider_actions"]
         )
 
+    def test_enhanced_follow_up_reuses_supplied_assessment(self):
+        patient = SimpleUTIPatientFactory()
+        assessment = assess_uti_patient(patient)
+
+        with patch("src.uti_algo.assess_uti_patient") as mock_assess:
+            plan = get_enhanced_follow_up_plan(patient, assessment)
+
+            mock_assess.assert_not_called()
+        assert plan["monitoring_checklist"] == assessment.recommendation.monitoring
+
     def test_enhanced_follow_up_elderly_patient(self):
         patient = ElderlyUTIPatientFactory()
 
@@ -631,6 +676,29 @@ class TestStateValidator:
 
         assert "fosfomycin_dose_check_3g_single_dose" in result.rules_fired
 
+    def test_validator_allergy_matches_free_text_terms(self):
+        patient = SimpleUTIPatientFactory()
+        patient.history.allergies = ["Sulfonamides (hives)"]
+        regimen_text = "TMP/SMX 160/800 mg PO BID x 3 days"
+        safety = {"approval_recommendation": "approve"}
+
+        result = state_validator(patient, regimen_text, safety)
+
+        assert "allergy_conflict_tmpsmx_or_trimethoprim" in result.contradictions
+        assert result.passed is False
+
+    def test_validator_tolerates_missing_or_enum_approval(self):
+        patient = SimpleUTIPatientFactory()
+        regimen_text = "nitrofurantoin 100 mg PO BID x 5 days"
+
+        missing = state_validator(patient, regimen_text, {"approval_recommendation": None})
+        rejected = state_validator(
+            patient, regimen_text, {"approval_recommendation": ApprovalDecision.reject},
+        )
+
+        assert missing.passed is True
+        assert "Safety rejected but regimen present" in rejected.contradictions
+
 
 class TestCreateAudit:
     def test_create_audit_structure(self):
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+from src.models import ApprovalDecision, Decision, RiskLevel, ValidatorResult
+from src.utils import (
+    llm_max_concurrency,
+    parse_approval,
+    parse_decision,
+    refresh_flags,
+    safe_model_dump,
+    should_verify,
+    weave_trace_sample_rate,
+)
+
+
+class TestSafeModelDump:
+    """Test normalization of agent outputs to dicts"""
+
+    def test_safe_model_dump_dict_passthrough(self):
+        """Test dicts are returned as-is without copying"""
+        data = {"passed": True}
+
+        assert safe_model_dump(data) is data
+
+    def test_safe_model_dump_model_pairs_and_none(self):
+        """Test models are dumped, pair iterables converted and None emptied"""
+        assert safe_model_dump(ValidatorResult(passed=False))["passed"] is False
+        assert safe_model_dump([("severity", "high")]) == {"severity": "high"}
+        assert safe_model_dump(None) == {}
+
+
+class TestParsers:
+    """Test decision and approval parsing"""
+
+    def test_parse_decision_values_and_fallback(self):
+        """Test known values map to Decision and unknown ones fall back"""
+        assert parse_decision("refer_recurrence") == Decision.refer_recurrence
+        assert parse_decision(Decision.recommend_treatment) == Decision.recommend_treatment
+        assert parse_decision("unknown") == Decision.no_antibiotics_not_met
+        assert parse_decision(None) == Decision.no_antibiotics_not_met
+
+    def test_parse_approval_case_insensitive_and_fallback(self):
+        """Test approval strings are matched case-insensitively"""
+        assert parse_approval("APPROVE") == ApprovalDecision.approve
+        assert parse_approval(ApprovalDecision.deny) == ApprovalDecision.deny
+        assert parse_approval("maybe") == ApprovalDecision.undecided
+
+
+class TestShouldVerify:
+    """Test verification trigger conditions"""
+
+    def test_should_verify_false_when_all_signals_low(self):
+        """Test no verification for confident, low-risk, passing plans"""
+        assert not should_verify(
+            {"confidence": 0.9},
+            {"passed": True, "severity": "low"},
+            {"risk_level": RiskLevel.low},
+        )
+
+    def test_should_verify_elevated_risk_enum_and_string(self):
+        """Test moderate/high risk triggers verification for enum or raw string"""
+        validator = {"passed": True, "severity": "low"}
+
+        assert should_verify({"confidence": 0.9}, validator, {"risk_level": RiskLevel.high})
+        assert should_verify({"confidence": 0.9}, validator, {"risk_level": "moderate"})
+
+    def test_should_verify_validator_model(self):
+        """Test validator severity is read from a ValidatorResult model"""
+        validator = ValidatorResult(passed=True, severity="moderate")
+
+        assert should_verify({"confidence": 0.9}, validator, None)
+
+    def test_should_verify_mixed_case_levels(self):
+        """Test risk and severity strings match regardless of case"""
+        validator = {"passed": True, "severity": "low"}
+
+        assert should_verify({"confidence": 0.9}, validator, {"risk_level": "High"})
+        assert should_verify(
+            {"confidence": 0.9},
+            {"passed": True, "severity": "Moderate"},
+            None,
+        )
+
+    def test_should_verify_low_confidence(self):
+        """Test confidence below threshold triggers verification"""
+        assert should_verify(
+            {"confidence": 0.5},
+            {"passed": True, "severity": "low"},
+            None,
+        )
+
+
+class TestLlmMaxConcurrency:
+    """Test LLM concurrency cap parsing"""
+
+    def test_llm_max_concurrency_default_and_invalid(self):
+        """Test the default cap and fallback for non-numeric values"""
+        with patch.dict(os.environ, {"LLM_MAX_CONCURRENCY": "4"}):
+            refresh_flags()
+            assert llm_max_concurrency() == 4
+        with patch.dict(os.environ, {"LLM_MAX_CONCURRENCY": "lots"}):
+            refresh_flags()
+            assert llm_max_concurrency() == 16
+        refresh_flags()
+
+
+class TestWeaveTraceSampleRate:
+    """Test Weave trace sample rate parsing"""
+
+    def test_weave_trace_sample_rate_clamped_and_invalid(self):
+        """Test rates are clamped to [0, 1] and invalid values trace everything"""
+        with patch.dict(os.environ, {"WEAVE_TRACE_SAMPLE_RATE": "0.25"}):
+            refresh_flags()
+            assert weave_trace_sample_rate() == 0.25
+        with patch.dict(os.environ, {"WEAVE_TRACE_SAMPLE_RATE": "5"}):
+            refresh_flags()
+            assert weave_trace_sample_rate() == 1.0
+        with patch.dict(os.environ, {"WEAVE_TRACE_SAMPLE_RATE": "often"}):
+            refresh_flags()
+            assert weave_trace_sample_rate() == 1.0
+        refresh_flags()